@@ -0,0 +1,171 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# calc_lexer.pyx
+# Versión en Cython del Lexer de prueba_calc_cientifica.py. Genera los mismos
+# tokens; prueba_calc_cientifica.py la usa automáticamente si está compilada:
+#     cythonize -i calc_lexer.pyx
+import re
+
+# Definición de tipos de token (mismos valores que en prueba_calc_cientifica.py)
+NUMBER  = 'NUMBER'
+ID      = 'ID'
+PLUS    = 'PLUS'
+MINUS   = 'MINUS'
+TIMES   = 'TIMES'
+DIVIDE  = 'DIVIDE'
+LPAREN  = 'LPAREN'
+RPAREN  = 'RPAREN'
+ASSIGN  = 'ASSIGN'
+EOF     = 'EOF'
+POWER   = 'POWER'
+INT_DIVIDE = 'INT_DIVIDE'
+
+# Camino general (no ASCII, errores y fin de texto), igual que en Python.
+_TOKEN_RE = re.compile(r"""
+    \s+
+  | (?P<NUMBER>\d+(?:\.\d*)?)
+  | (?P<ID>[^\W\d]\w*)
+  | (?P<POWER>\*\*)
+  | (?P<INT_DIVIDE>//)
+  | (?P<PLUS>\+)
+  | (?P<MINUS>-)
+  | (?P<TIMES>\*)
+  | (?P<DIVIDE>/)
+  | (?P<LPAREN>\()
+  | (?P<RPAREN>\))
+  | (?P<ASSIGN>=)
+""", re.VERBOSE)
+
+# Clases de carácter ASCII, indexadas por código de carácter.
+cdef enum:
+    OTHER = 0
+    SPACE = 1
+    DIGIT = 2
+    IDENT = 3
+    OPERATOR = 4
+
+cdef unsigned char CHAR_CLASS[128]
+
+cdef int _init_char_class() except -1:
+    cdef int i
+    for i in range(128):
+        ch = chr(i)
+        if ch.isspace():
+            CHAR_CLASS[i] = SPACE
+        elif ch.isdigit():
+            CHAR_CLASS[i] = DIGIT
+        elif ch.isalpha() or ch == '_':
+            CHAR_CLASS[i] = IDENT
+        elif ch in '+-*/()=':
+            CHAR_CLASS[i] = OPERATOR
+        else:
+            CHAR_CLASS[i] = OTHER
+    return 0
+
+_init_char_class()
+
+# Operadores de un carácter, indexados por código de carácter.
+_OPERATORS = {ord('+'): (PLUS, '+'), ord('-'): (MINUS, '-'),
+              ord('*'): (TIMES, '*'), ord('/'): (DIVIDE, '/'),
+              ord('('): (LPAREN, '('), ord(')'): (RPAREN, ')'),
+              ord('='): (ASSIGN, '=')}
+
+# Clase Token: representa un token con su tipo y valor.
+cdef class Token:
+    cdef public object type
+    cdef public object value
+
+    def __init__(self, type, value):
+        self.type = type
+        self.value = value
+
+    def __repr__(self):
+        return f'Token({self.type}, {repr(self.value)})'
+
+# Lexer: convierte el texto de entrada en una secuencia de tokens.
+cdef class Lexer:
+    cdef public unicode text
+    cdef public Py_ssize_t pos
+    cdef Py_ssize_t n
+
+    def __init__(self, unicode text):
+        self.text = text
+        self.pos = 0
+        self.n = len(text)
+
+    def get_next_token(self):
+        """Devuelve el siguiente token encontrado en el texto."""
+        cdef unicode text = self.text
+        cdef Py_ssize_t pos = self.pos
+        cdef Py_ssize_t n = self.n
+        cdef Py_UCS4 ch
+        cdef unsigned char char_class
+        while pos < n:
+            ch = text[pos]
+            char_class = CHAR_CLASS[ch] if ch < 128 else OTHER
+            if char_class == SPACE:
+                pos += 1
+            elif char_class == DIGIT:
+                return self._number(pos)
+            elif char_class == IDENT:
+                return self._identifier(pos)
+            elif char_class == OPERATOR:
+                if (ch == u'*' or ch == u'/') and pos + 1 < n and text[pos + 1] == ch:
+                    self.pos = pos + 2
+                    if ch == u'*':
+                        return Token(POWER, '**')
+                    return Token(INT_DIVIDE, '//')
+                self.pos = pos + 1
+                return Token(*_OPERATORS[<int>ch])
+            else:
+                break
+        self.pos = pos
+        return self._next_token_regex()
+
+    cdef Token _number(self, Py_ssize_t start):
+        """Extrae un número (entero o flotante) que empieza en `start`."""
+        cdef unicode text = self.text
+        cdef Py_ssize_t pos = start
+        cdef Py_ssize_t n = self.n
+        cdef bint is_float = False
+        while pos < n and text[pos].isdecimal():
+            pos += 1
+        if pos < n and text[pos] == u'.':
+            is_float = True
+            pos += 1
+            while pos < n and text[pos].isdecimal():
+                pos += 1
+        self.pos = pos
+        lexeme = text[start:pos]
+        return Token(NUMBER, float(lexeme) if is_float else int(lexeme))
+
+    cdef Token _identifier(self, Py_ssize_t start):
+        """Extrae un identificador que empieza en `start`."""
+        cdef unicode text = self.text
+        cdef Py_ssize_t pos = start + 1
+        cdef Py_ssize_t n = self.n
+        cdef Py_UCS4 ch
+        while pos < n:
+            ch = text[pos]
+            if not (ch.isalnum() or ch == u'_'):
+                break
+            pos += 1
+        self.pos = pos
+        return Token(ID, text[start:pos])
+
+    def _next_token_regex(self):
+        """Camino general (no ASCII, errores y fin de texto) con _TOKEN_RE."""
+        text = self.text
+        while True:
+            m = _TOKEN_RE.match(text, self.pos)
+            if m is None:
+                if self.pos >= len(text):
+                    return Token(EOF, None)
+                raise Exception(f"Carácter inesperado: {text[self.pos]}")
+            self.pos = m.end()
+            kind = m.lastgroup
+            if kind is None:
+                continue  # espacios en blanco
+            lexeme = m.group()
+            if kind == NUMBER:
+                return Token(NUMBER, float(lexeme) if '.' in lexeme else int(lexeme))
+            return Token(kind, lexeme)
@@ -1,3 +1,7 @@
+import re
+from array import array
+from functools import lru_cache
+
 # Definición de tipos de token
 NUMBER  = 'NUMBER'
 ID      = 'ID'
@@ -12,8 +16,53 @@ EOF     = 'EOF'
 POWER   = 'POWER'
 INT_DIVIDE = 'INT_DIVIDE'
 
+# Expresión regular maestra: cada grupo con nombre es un tipo de token.
+# Los espacios no tienen nombre (lastgroup = None) y se descartan.
+# Los operadores compuestos ('**', '//') van antes que los simples.
+_TOKEN_RE = re.compile(r"""
+    \s+
+  | (?P<NUMBER>\d+(?:\.\d*)?)
+  | (?P<ID>[^\W\d]\w*)
+  | (?P<POWER>\*\*)
+  | (?P<INT_DIVIDE>//)
+  | (?P<PLUS>\+)
+  | (?P<MINUS>-)
+  | (?P<TIMES>\*)
+  | (?P<DIVIDE>/)
+  | (?P<LPAREN>\()
+  | (?P<RPAREN>\))
+  | (?P<ASSIGN>=)
+""", re.VERBOSE)
+
+# Clases de carácter para el camino rápido del lexer. La tabla se indexa
+# con ord(ch) (solo ASCII) y evita probar las alternativas de _TOKEN_RE
+# una por una; cualquier otro carácter se resuelve con _TOKEN_RE.
+_OTHER, _SPACE, _DIGIT, _IDENT, _OPERATOR = range(5)
+
+def _char_class(ch):
+    if ch.isspace():
+        return _SPACE
+    if ch.isdigit():
+        return _DIGIT
+    if ch.isalpha() or ch == '_':
+        return _IDENT
+    if ch in '+-*/()=':
+        return _OPERATOR
+    return _OTHER
+
+_CHAR_CLASS = bytes(_char_class(chr(i)) for i in range(128))
+
+_NUMBER_RE = re.compile(r'\d+(?:\.\d*)?')
+_ID_TAIL_RE = re.compile(r'\w*')
+
+# Operadores de un carácter y operadores dobles ('**', '//').
+_OPERATORS = {'+': PLUS, '-': MINUS, '*': TIMES, '/': DIVIDE,
+              '(': LPAREN, ')': RPAREN, '=': ASSIGN}
+_DOUBLE_OPERATORS = {'*': (POWER, '**'), '/': (INT_DIVIDE, '//')}
+
 # Clase Token: representa un token con su tipo y valor.
 class Token:
+    __slots__ = ('type', 'value')
     def __init__(self, type, value):
         self.type = type
         self.value = value
@@ -25,99 +74,99 @@ class Lexer:
     def __init__(self, text):
         self.text = text
         self.pos = 0
-        self.current_char = self.text[self.pos] if self.text else None
 
-    def advance(self):
-        """Avanza un carácter en el texto de entrada."""
-        self.pos += 1
-        if self.pos < len(self.text):
-            self.current_char = self.text[self.pos]
-        else:
-            self.current_char = None
+    def get_next_token(self):
+        """Devuelve el siguiente token encontrado en el texto."""
+        text = self.text
+        pos = self.pos
+        n = len(text)
+        while pos < n:
+            ch = text[pos]
+            code = ord(ch)
+            char_class = _CHAR_CLASS[code] if code < 128 else _OTHER
+            if char_class == _SPACE:
+                pos += 1
+            elif char_class == _DIGIT:
+                m = _NUMBER_RE.match(text, pos)
+                self.pos = m.end()
+                lexeme = m.group()
+                return Token(NUMBER, float(lexeme) if '.' in lexeme else int(lexeme))
+            elif char_class == _IDENT:
+                self.pos = _ID_TAIL_RE.match(text, pos + 1).end()
+                return Token(ID, text[pos:self.pos])
+            elif char_class == _OPERATOR:
+                if ch in _DOUBLE_OPERATORS and text.startswith(ch, pos + 1):
+                    self.pos = pos + 2
+                    return Token(*_DOUBLE_OPERATORS[ch])
+                self.pos = pos + 1
+                return Token(_OPERATORS[ch], ch)
+            else:
+                break
+        self.pos = pos
+        return self._next_token_regex()
 
-    def peek(self):
-        """Mira el siguiente carácter sin avanzar."""
-        peek_pos = self.pos + 1
-        if peek_pos < len(self.text):
-            return self.text[peek_pos]
-        else:
-            return None
-
-    def skip_whitespace(self):
-        """Omite los espacios en blanco."""
-        while self.current_char is not None and self.current_char.isspace():
-            self.advance()
-
-    def number(self):
-        """Extrae un número (entero o flotante)."""
-        result = ''
-        dot_count = 0
-        while self.current_char is not None and (self.current_char.isdigit() or self.current_char == '.'):
-            if self.current_char == '.':
-                dot_count += 1
-                if dot_count > 1:
-                    break  # No permitimos más de un punto
-            result += self.current_char
-            self.advance()
-        if dot_count == 0:
-            return Token(NUMBER, int(result))
-        else:
-            return Token(NUMBER, float(result))
+    def _next_token_regex(self):
+        """Camino general (no ASCII, errores y fin de texto) con _TOKEN_RE."""
+        text = self.text
+        while True:
+            m = _TOKEN_RE.match(text, self.pos)
+            if m is None:
+                if self.pos >= len(text):
+                    return Token(EOF, None)
+                raise Exception(f"Carácter inesperado: {text[self.pos]}")
+            self.pos = m.end()
+            kind = m.lastgroup
+            if kind is None:
+                continue  # espacios en blanco
+            lexeme = m.group()
+            if kind == NUMBER:
+                return Token(NUMBER, float(lexeme) if '.' in lexeme else int(lexeme))
+            return Token(kind, lexeme)
 
-    def identifier(self):
-        """Extrae un identificador (variable)."""
-        result = ''
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            result += self.current_char
-            self.advance()
-        return Token(ID, result)
+# Si el lexer en Cython (calc_lexer.pyx) está compilado, se usa en su lugar.
+try:
+    from calc_lexer import Lexer
+except ImportError:
+    pass
 
-    def get_next_token(self):
-        """Devuelve el siguiente token encontrado en el texto."""
-        while self.current_char is not None:
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-            if self.current_char.isdigit():
-                return self.number()
-            if self.current_char.isalpha() or self.current_char == '_':
-                return self.identifier()
-            if self.current_char == '+':
-                self.advance()
-                return Token(PLUS, '+')
-            if self.current_char == '-':
-                self.advance()
-                return Token(MINUS, '-')
-            if self.current_char == '*':
-                self.advance()
-                if self.peek() == '*':
-                    self.advance()
-                    return Token(POWER, '**')
-                else:
-                    return Token(TIMES, '*')
-            if self.current_char == '/':
-                self.advance()
-                if self.peek() == '/':
-                    self.advance()
-                    return Token(INT_DIVIDE, '//')
-                else:
-                    return Token(DIVIDE, '/')
-            if self.current_char == '(':
-                self.advance()
-                return Token(LPAREN, '(')
-            if self.current_char == ')':
-                self.advance()
-                return Token(RPAREN, ')')
-                return Token(ASSIGN, '=')
-            raise Exception(f"Carácter inesperado: {self.current_char}")
-        return Token(EOF, None)
+# Códigos de operación. El parser construye un AST de tuplas etiquetadas:
+#   (OP_NUM, valor), (OP_VAR, nombre), (OP_NEG, operando),
+#   (OP_ADD, izq, der), ..., (OP_ASSIGN, nombre, expresión)
+OP_NUM     = 0
+OP_VAR     = 1
+OP_NEG     = 2
+OP_ADD     = 3
+OP_SUB     = 4
+OP_MUL     = 5
+OP_DIV     = 6
+OP_INT_DIV = 7
+OP_POW     = 8
+OP_ASSIGN  = 9
+
+# Operador binario asociado a cada tipo de token.
+_BINOPS = {
+    PLUS: OP_ADD,
+    MINUS: OP_SUB,
+    TIMES: OP_MUL,
+    DIVIDE: OP_DIV,
+    INT_DIVIDE: OP_INT_DIV,
+    POWER: OP_POW,
+}
 
 # Parser: analiza la secuencia de tokens utilizando recursión de acuerdo a la gramática.
+# Ya no evalúa mientras analiza: devuelve un AST que se evalúa con evaluate().
 class Parser:
-    def __init__(self, lexer, env):
+    def __init__(self, lexer):
         self.lexer = lexer
-        self.current_token = self.lexer.get_next_token()
-        self.env = env  # entorno para almacenar las variables
+        # Se tokeniza toda la entrada de una vez; el parser avanza por índice.
+        self.tokens = []
+        token = self.lexer.get_next_token()
+        while token.type != EOF:
+            self.tokens.append(token)
+            token = self.lexer.get_next_token()
+        self.tokens.append(token)
+        self.pos = 0
+        self.current_token = self.tokens[0]
 
     def error(self, msg):
         raise Exception("Error de sintaxis: " + msg)
@@ -125,7 +174,8 @@ class Parser:
     def eat(self, token_type):
         """Consume el token actual si coincide con el tipo esperado."""
         if self.current_token.type == token_type:
-            self.current_token = self.lexer.get_next_token()
+            self.pos += 1
+            self.current_token = self.tokens[self.pos]
         else:
             self.error(f"Se esperaba {token_type}, se encontró {self.current_token.type}")
 
@@ -144,15 +194,8 @@ class Parser:
         statement ::= assignment | expression
         Si el token actual es ID y el siguiente es '=', se trata de una asignación.
         """
-        if self.current_token.type == ID:
-            # Se hace una verificación preliminar: ¿existe un '=' después del ID?
-            # token_backup = self.current_token
-            # lexer_backup_pos = self.lexer.pos
-            # lexer_backup_char = self.lexer.current_char
-
-            next_token = self.lexer.get_next_token()
-            if next_token.type == ASSIGN:
-                return self.assignment()
+        if self.current_token.type == ID and self.tokens[self.pos + 1].type == ASSIGN:
+            return self.assignment()
 
         # Si no es asignación, se procesa como expresión.
         return self.expression()
@@ -160,54 +203,35 @@ class Parser:
     def assignment(self):
         """
         assignment ::= 'ID' '=' expression
-        Almacena el valor de la expresión en el entorno.
         """
         var_name = self.current_token.value
         self.eat(ID)
         self.eat(ASSIGN)
-        value = self.expression()
-        self.env[var_name] = value
-        return value
+        return (OP_ASSIGN, var_name, self.expression())
 
     def expression(self):
         """
         expression ::= term (('+' | '-') term)*
         """
-        result = self.term()
-        while self.current_token.type in (PLUS, MINUS):
-            if self.current_token.type == PLUS:
-                self.eat(PLUS)
-                result += self.term()
-            elif self.current_token.type == MINUS:
-                self.eat(MINUS)
-                result -= self.term()
-        return result
+        node = self.term()
+        token_type = self.current_token.type
+        while token_type in (PLUS, MINUS):
+            self.eat(token_type)
+            node = (_BINOPS[token_type], node, self.term())
+            token_type = self.current_token.type
+        return node
 
     def term(self):
         """
-        term ::= factor (('*' | '/' | '//') factor)*
+        term ::= factor (('*' | '/' | '//' | '**') factor)*
         """
-        result = self.factor()
-        while self.current_token.type in (TIMES, DIVIDE, INT_DIVIDE, POWER):
-            if self.current_token.type == TIMES:
-                self.eat(TIMES)
-                result *= self.factor()
-            elif self.current_token.type == DIVIDE:
-                self.eat(DIVIDE)
-                divisor = self.factor()
-                if divisor == 0:
-                    raise Exception("Error: División por cero")
-                result /= divisor
-            elif self.current_token.type == INT_DIVIDE:
-                self.eat(INT_DIVIDE)
-                divisor = self.factor()
-                if divisor == 0:
-                    raise Exception("Error: División por cero")
-                result //= divisor
-            elif self.current_token.type == POWER:
-                self.eat(POWER)
-                result **= self.factor()
-        return result
+        node = self.factor()
+        token_type = self.current_token.type
+        while token_type in (TIMES, DIVIDE, INT_DIVIDE, POWER):
+            self.eat(token_type)
+            node = (_BINOPS[token_type], node, self.factor())
+            token_type = self.current_token.type
+        return node
 
     def factor(self):
         """
@@ -216,24 +240,195 @@ class Parser:
         token = self.current_token
         if token.type == NUMBER:
             self.eat(NUMBER)
-            return token.value
+            return (OP_NUM, token.value)
         elif token.type == ID:
             self.eat(ID)
-            if token.value in self.env:
-                return self.env[token.value]
-            else:
-                raise Exception(f"Variable '{token.value}' no definida")
+            return (OP_VAR, token.value)
         elif token.type == LPAREN:
             self.eat(LPAREN)
-            result = self.expression()
+            node = self.expression()
             self.eat(RPAREN)
-            return result
+            return node
         elif token.type == MINUS:
             self.eat(MINUS)
-            return -self.factor()
+            return (OP_NEG, self.factor())
         else:
             self.error("Factor inesperado")
 
+def evaluate(node, env):
+    """
+    Evalúa un AST sobre el entorno `env` (nombre -> valor).
+    Conserva la aritmética de Python (enteros de precisión arbitraria).
+    """
+    op = node[0]
+    if op == OP_NUM:
+        return node[1]
+    if op == OP_VAR:
+        if node[1] in env:
+            return env[node[1]]
+        raise Exception(f"Variable '{node[1]}' no definida")
+    if op == OP_NEG:
+        return -evaluate(node[1], env)
+    if op == OP_ASSIGN:
+        value = evaluate(node[2], env)
+        env[node[1]] = value
+        return value
+    left = evaluate(node[1], env)
+    right = evaluate(node[2], env)
+    if op == OP_ADD:
+        return left + right
+    if op == OP_SUB:
+        return left - right
+    if op == OP_MUL:
+        return left * right
+    if op == OP_POW:
+        return left ** right
+    if right == 0:
+        raise Exception("Error: División por cero")
+    if op == OP_DIV:
+        return left / right
+    return left // right
+
+# ---------------------------------------------------------------------
+# Programa plano y evaluador compilado (numba)
+# ---------------------------------------------------------------------
+# Para evaluar una misma fórmula muchas veces (p. ej. sobre columnas de
+# datos) el AST se aplana en arreglos paralelos en notación postfija y
+# se ejecuta con una máquina de pila. Si numba está instalado la máquina
+# de pila se compila a código nativo; si no, corre en Python puro.
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+def _new_array(typecode, values):
+    """Crea un arreglo numpy si está disponible, o un array.array si no."""
+    if np is not None:
+        return np.array(values, dtype={'b': np.int8, 'i': np.int32, 'd': np.float64}[typecode])
+    return array(typecode, values)
+
+def flatten(node):
+    """
+    Aplana una expresión a (ops, args, consts, names):
+    - ops:    código de operación de cada instrucción (int8)
+    - args:   índice en consts (OP_NUM) o en names (OP_VAR); 0 en otro caso (int32)
+    - consts: constantes numéricas (float64)
+    - names:  nombres de variables, en el orden de sus índices
+    """
+    ops, args, consts, names = [], [], [], {}
+    stack = [(node, False)]
+    while stack:
+        node, visited = stack.pop()
+        op = node[0]
+        if op == OP_NUM:
+            ops.append(OP_NUM)
+            args.append(len(consts))
+            consts.append(float(node[1]))
+        elif op == OP_VAR:
+            ops.append(OP_VAR)
+            args.append(names.setdefault(node[1], len(names)))
+        elif op == OP_ASSIGN:
+            raise Exception("Una asignación no se puede aplanar")
+        elif visited:
+            ops.append(op)
+            args.append(0)
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node[1:]))
+    return (_new_array('b', ops), _new_array('i', args),
+            _new_array('d', consts), tuple(names))
+
+@njit(cache=True)
+def eval_program(ops, args, consts, env, stack):
+    """
+    Máquina de pila sobre un programa plano. `env` contiene el valor de
+    cada variable según su índice y `stack` es un búfer de len(ops) floats.
+    """
+    sp = 0
+    for i in range(len(ops)):
+        op = ops[i]
+        if op == OP_NUM:
+            stack[sp] = consts[args[i]]
+            sp += 1
+        elif op == OP_VAR:
+            stack[sp] = env[args[i]]
+            sp += 1
+        elif op == OP_NEG:
+            stack[sp - 1] = -stack[sp - 1]
+        else:
+            sp -= 1
+            right = stack[sp]
+            left = stack[sp - 1]
+            if op == OP_ADD:
+                stack[sp - 1] = left + right
+            elif op == OP_SUB:
+                stack[sp - 1] = left - right
+            elif op == OP_MUL:
+                stack[sp - 1] = left * right
+            elif op == OP_POW:
+                stack[sp - 1] = left ** right
+            elif right == 0.0:
+                raise ZeroDivisionError("Error: División por cero")
+            elif op == OP_DIV:
+                stack[sp - 1] = left / right
+            else:
+                stack[sp - 1] = left // right
+    return stack[0]
+
+@njit(cache=True)
+def eval_rows(ops, args, consts, rows, out, stack):
+    """Evalúa el programa una vez por cada fila de `rows` (un entorno por fila)."""
+    for r in range(len(out)):
+        out[r] = eval_program(ops, args, consts, rows[r], stack)
+    return out
+
+@lru_cache(maxsize=1024)
+def _compile(text):
+    """
+    Analiza una declaración y devuelve su AST. El AST es inmutable, así que
+    se guarda por texto: repetir una entrada no vuelve a tokenizar ni analizar.
+    """
+    return Parser(Lexer(text)).statement()
+
+@lru_cache(maxsize=1024)
+def _program(text):
+    """Versión aplanada de _compile(text); también se reutiliza por texto."""
+    return flatten(_compile(text))
+
+def evaluate_many(text, bindings):
+    """
+    Evalúa la expresión `text` una vez por fila. `bindings` asocia a cada
+    variable una secuencia de valores; todas deben tener el mismo largo.
+    Devuelve la lista de resultados como float.
+    """
+    ops, args, consts, names = _program(text)
+    for name in names:
+        if name not in bindings:
+            raise Exception(f"Variable '{name}' no definida")
+    columns = [bindings[name] for name in names]
+    count = len(columns[0]) if columns else 1
+    for name, column in zip(names, columns):
+        if len(column) != count:
+            raise Exception(f"La variable '{name}' tiene {len(column)} valores; se esperaban {count}")
+    if np is not None:
+        rows = np.empty((count, max(len(names), 1)))
+        for j, column in enumerate(columns):
+            rows[:, j] = column
+        out = np.empty(count)
+        stack = np.empty(len(ops))
+    else:
+        rows = [array('d', values) for values in zip(*columns)] or [array('d')]
+        out = array('d', bytes(8 * count))
+        stack = array('d', bytes(8 * len(ops)))
+    return list(eval_rows(ops, args, consts, rows, out, stack))
+
 # Función principal que implementa un bucle interactivo para la calculadora.
 def calculator():
     print("Calculadora - Analizador Descendente Recursivo")
@@ -246,11 +441,9 @@ def calculator():
             if text.lower() == "exit":
                 print("Saliendo de la calculadora.")
                 exit()
-            # Se crea el lexer y el parser para la línea ingresada.
-            lexer = Lexer(text)
-            parser = Parser(lexer, env)
-            # Se procesa una declaración (assignment o expresión)
-            result = parser.statement()
+            # Se analiza la línea (o se toma del caché) y se evalúa
+            # la declaración (assignment o expresión).
+            result = evaluate(_compile(text), env)
             print("Resultado:", result)
         except Exception as e:
             print("Error:", e)
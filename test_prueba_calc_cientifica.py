@@ -0,0 +1,87 @@
+import unittest
+from prueba_calc_cientifica import (Lexer, Parser, evaluate, evaluate_many, flatten, EOF, NUMBER, ID, POWER, INT_DIVIDE,
+                                    TIMES, DIVIDE, ASSIGN, MINUS)
+
+def token_types(text):
+    lexer = Lexer(text)
+    tokens = []
+    token = lexer.get_next_token()
+    while token.type != EOF:
+        tokens.append((token.type, token.value))
+        token = lexer.get_next_token()
+    return tokens
+
+class TestLexer(unittest.TestCase):
+    def test_double_operators(self):
+        # '**' y '//' se reconocen como un solo token (antes se partían en dos)
+        self.assertEqual(token_types("2 ** 3 // 4"),
+                         [(NUMBER, 2), (POWER, '**'), (NUMBER, 3), (INT_DIVIDE, '//'), (NUMBER, 4)])
+
+    def test_single_operators(self):
+        self.assertEqual(token_types("a*b/c-1"),
+                         [(ID, 'a'), (TIMES, '*'), (ID, 'b'), (DIVIDE, '/'), (ID, 'c'), (MINUS, '-'), (NUMBER, 1)])
+
+    def test_assign(self):
+        self.assertEqual(token_types("x = 2.5"), [(ID, 'x'), (ASSIGN, '='), (NUMBER, 2.5)])
+
+    def test_unexpected_character(self):
+        with self.assertRaises(Exception):
+            token_types("2 $ 3")
+
+def run(lines):
+    """Analiza y evalúa cada línea sobre un mismo entorno."""
+    env = {}
+    return [evaluate(Parser(Lexer(line)).statement(), env) for line in lines], env
+
+class TestParser(unittest.TestCase):
+    def test_assignment(self):
+        # statement() perdía el ID inicial y toda asignación fallaba
+        results, env = run(["x = 4", "y = x * 2 + 1", "y ** 2 // 10"])
+        self.assertEqual(results, [4, 9, 8])
+        self.assertEqual(env, {'x': 4, 'y': 9})
+
+    def test_expression_starting_with_id(self):
+        results, env = run(["a = 3", "a - 1"])
+        self.assertEqual(results, [3, 2])
+
+    def test_undefined_variable(self):
+        with self.assertRaises(Exception):
+            run(["z + 1"])
+
+class TestEvaluateMany(unittest.TestCase):
+    def test_matches_evaluate(self):
+        bindings = {'x': [1, 2.5, -3, 0], 'y': [4, 0.5, 2, 7]}
+        formulas = ["x + y * 2", "(x - y) / 4", "-x ** 2 + y", "x // 1 - -y", "3 * (x + 1) - y / 2"]
+        for text in formulas:
+            with self.subTest(text=text):
+                expected = [float(evaluate(Parser(Lexer(text)).statement(), {'x': x, 'y': y}))
+                            for x, y in zip(bindings['x'], bindings['y'])]
+                results = evaluate_many(text, bindings)
+                self.assertEqual(len(results), len(expected))
+                for result, value in zip(results, expected):
+                    self.assertAlmostEqual(result, value)
+
+    def test_constant_formula(self):
+        # Sin variables no hay columnas: se evalúa una sola vez
+        self.assertEqual(evaluate_many("2 ** 3 + 1", {}), [9.0])
+
+    def test_assignment_is_rejected(self):
+        with self.assertRaises(Exception):
+            flatten(Parser(Lexer("x = 1 + 2")).statement())
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            evaluate_many("x / y", {'x': [1, 2], 'y': [1, 0]})
+
+    def test_undefined_variable(self):
+        with self.assertRaises(Exception):
+            evaluate_many("x + z", {'x': [1]})
+
+    def test_column_lengths_must_match(self):
+        for bindings in ({'a': [1, 2, 3], 'b': [1]}, {'a': [1], 'b': [1, 2]}):
+            with self.subTest(bindings=bindings):
+                with self.assertRaisesRegex(Exception, "'b' tiene"):
+                    evaluate_many("a + b", bindings)
+
+if __name__ == "__main__":
+    unittest.main()
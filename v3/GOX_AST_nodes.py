@@ -3,7 +3,7 @@
 
 class ASTNode:
     """Base class for all AST nodes."""
-    pass
+    __slots__ = ()
 
 # ---------------------------------------------------------------------
 # Expressions
@@ -11,6 +11,7 @@ class ASTNode:
 
 class Integer(ASTNode):
     """Represents an integer literal."""
+    __slots__ = ('value',)
     def __init__(self, value):
         self.value = value
 
@@ -19,6 +20,7 @@ class Integer(ASTNode):
 
 class Float(ASTNode):
     """Represents a float literal."""
+    __slots__ = ('value',)
     def __init__(self, value):
         self.value = value
 
@@ -27,6 +29,7 @@ class Float(ASTNode):
 
 class BinOp(ASTNode):
     """Represents a binary operation (e.g., 2 + 3)."""
+    __slots__ = ('op', 'left', 'right')
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
@@ -37,6 +40,7 @@ class BinOp(ASTNode):
 
 class UnaryOp(ASTNode):
     """Represents a unary operation (e.g., -5, !true)."""
+    __slots__ = ('op', 'operand')
     def __init__(self, op, operand):
         self.op = op
         self.operand = operand
@@ -46,6 +50,7 @@ class UnaryOp(ASTNode):
 
 class Location(ASTNode):
     """Represents a location (variable or memory address)."""
+    __slots__ = ('name',)
     def __init__(self, name):
         self.name = name
 
@@ -54,6 +59,7 @@ class Location(ASTNode):
 
 class FunctionCall(ASTNode):
     """Represents a function call."""
+    __slots__ = ('name', 'args')
     def __init__(self, name, args):
         self.name = name
         self.args = args
@@ -63,6 +69,7 @@ class FunctionCall(ASTNode):
 
 class TypeCast(ASTNode):
     """Represents a type cast (e.g., int(3.14))."""
+    __slots__ = ('target_type', 'expr')
     def __init__(self, target_type, expr):
         self.target_type = target_type
         self.expr = expr
@@ -76,6 +83,7 @@ class TypeCast(ASTNode):
 
 class String(ASTNode):
     """Represents a string literal."""
+    __slots__ = ('value',)
     def __init__(self, value):
         self.value = value
 
@@ -84,6 +92,7 @@ class String(ASTNode):
 
 class Boolean(ASTNode):
     """Represents a boolean literal."""
+    __slots__ = ('value',)
     def __init__(self, value):
         self.value = value
 
@@ -92,6 +101,7 @@ class Boolean(ASTNode):
 
 class CompareOp(ASTNode):
     """Represents a comparison operation (e.g., x > y)."""
+    __slots__ = ('op', 'left', 'right')
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
@@ -102,6 +112,7 @@ class CompareOp(ASTNode):
 
 class LogicalOp(ASTNode):
     """Represents a logical operation (e.g., x && y)."""
+    __slots__ = ('op', 'left', 'right')
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
@@ -112,6 +123,7 @@ class LogicalOp(ASTNode):
 
 class ArrayLiteral(ASTNode):
     """Represents an array literal."""
+    __slots__ = ('elements',)
     def __init__(self, elements):
         self.elements = elements
 
@@ -120,6 +132,7 @@ class ArrayLiteral(ASTNode):
 
 class IndexAccess(ASTNode):
     """Represents an index access (e.g., arr[i])."""
+    __slots__ = ('array', 'index')
     def __init__(self, array, index):
         self.array = array
         self.index = index
@@ -129,6 +142,7 @@ class IndexAccess(ASTNode):
 
 class Char(ASTNode):
     """Represents a character literal."""
+    __slots__ = ('value',)
     def __init__(self, value):
         self.value = value
 
@@ -137,6 +151,7 @@ class Char(ASTNode):
 
 class Dereference(ASTNode):
     """Represents a dereference operation."""
+    __slots__ = ('location',)
     def __init__(self, location):
         self.location = location
 
@@ -149,6 +164,7 @@ class Dereference(ASTNode):
 
 class VariableDecl(ASTNode):
     """Represents a variable declaration."""
+    __slots__ = ('name', 'var_type', 'value')
     def __init__(self, name, var_type, value=None):
         self.name = name
         self.var_type = var_type
@@ -159,6 +175,7 @@ class VariableDecl(ASTNode):
 
 class ConstantDecl(ASTNode):
     """Represents a constant declaration."""
+    __slots__ = ('name', 'value')
     def __init__(self, name, value):
         self.name = name
         self.value = value
@@ -168,6 +185,7 @@ class ConstantDecl(ASTNode):
 
 class FunctionDecl(ASTNode):
     """Represents a function declaration."""
+    __slots__ = ('name', 'params', 'return_type', 'body')
     def __init__(self, name, params, return_type, body):
         self.name = name
         self.params = params
@@ -183,6 +201,7 @@ class FunctionDecl(ASTNode):
 
 class Assignment(ASTNode):
     """Represents an assignment (e.g., x = 10)."""
+    __slots__ = ('location', 'expr')
     def __init__(self, location, expr):
         self.location = location
         self.expr = expr
@@ -192,6 +211,7 @@ class Assignment(ASTNode):
 
 class Print(ASTNode):
     """Represents a print statement (e.g., print x)."""
+    __slots__ = ('expr',)
     def __init__(self, expr):
         self.expr = expr
 
@@ -200,6 +220,7 @@ class Print(ASTNode):
 
 class If(ASTNode):
     """Represents an if/else statement."""
+    __slots__ = ('test', 'consequence', 'alternative')
     def __init__(self, test, consequence, alternative=None):
         self.test = test
         self.consequence = consequence
@@ -210,6 +231,7 @@ class If(ASTNode):
 
 class While(ASTNode):
     """Represents a while loop."""
+    __slots__ = ('test', 'body')
     def __init__(self, test, body):
         self.test = test
         self.body = body
@@ -219,6 +241,7 @@ class While(ASTNode):
 
 class Return(ASTNode):
     """Represents a return statement (e.g., return x)."""
+    __slots__ = ('expr',)
     def __init__(self, expr):
         self.expr = expr
 
@@ -231,6 +254,7 @@ class Return(ASTNode):
 
 class For(ASTNode):
     """Represents a for loop."""
+    __slots__ = ('init', 'test', 'update', 'body')
     def __init__(self, init, test, update, body):
         self.init = init
         self.test = test
@@ -242,6 +266,7 @@ class For(ASTNode):
 
 class Block(ASTNode):
     """Represents a block of statements."""
+    __slots__ = ('statements',)
     def __init__(self, statements):
         self.statements = statements
 
@@ -250,11 +275,13 @@ class Block(ASTNode):
 
 class Break(ASTNode):
     """Represents a break statement."""
+    __slots__ = ()
     def __repr__(self):
         return "Break()"
 
 class Continue(ASTNode):
     """Represents a continue statement."""
+    __slots__ = ()
     def __repr__(self):
         return "Continue()"
 
@@ -284,6 +311,7 @@ class SymbolTable:
 
 class Parameter(ASTNode):
     """Represents a function parameter."""
+    __slots__ = ('name', 'param_type')
     def __init__(self, name, param_type):
         self.name = name
         self.param_type = param_type
@@ -293,6 +321,7 @@ class Parameter(ASTNode):
 
 class Program(ASTNode):
     """Root node representing a complete program."""
+    __slots__ = ('statements',)
     def __init__(self, statements):
         self.statements = statements
 
@@ -302,6 +331,7 @@ class Program(ASTNode):
 # Agregar nueva definición para ImportDecl
 class ImportDecl(ASTNode):
     """Represents an import declaration (e.g., import myModule;)"""
+    __slots__ = ('module_name',)
     def __init__(self, module_name):
         self.module_name = module_name
 
@@ -310,6 +340,7 @@ class ImportDecl(ASTNode):
 
 class FunctionImportDecl(ASTNode):
     """Represents a function import declaration with signature."""
+    __slots__ = ('module_name', 'params', 'return_type')
     def __init__(self, module_name, params, return_type):
         self.module_name = module_name
         self.params = params
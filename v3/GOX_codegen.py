@@ -0,0 +1,294 @@
+# GOX_codegen.py - Compile a GoxLang AST to a Python function
+#
+# The AST is walked once and turned into Python source, which is compiled
+# with compile()/exec. Running the result uses CPython's bytecode
+# interpreter instead of dispatching on every AST node at run time.
+
+from GOX_AST_nodes import Integer, Float, Boolean, String, Char, BinOp, UnaryOp, Location, FunctionCall
+from GOX_AST_nodes import Assignment, If, ConstantDecl, VariableDecl, FunctionDecl, While, Program, FunctionImportDecl, Dereference
+import functools
+import math
+import re
+
+# GOX identifiers are emitted with this prefix so they can never collide
+# with Python keywords, builtins or the rt_* runtime helpers below.
+_NAME_PREFIX = 'g_'
+
+# Operators that map directly onto a Python operator
+_BINARY_OPS = {
+    '+': '+', '-': '-', '*': '*',
+    '<': '<', '>': '>', '<=': '<=', '>=': '>=', '==': '==', '!=': '!=',
+    '&&': 'and', '||': 'or',
+}
+
+# Operators with C-like integer semantics (truncation toward zero)
+_BINARY_HELPERS = {'/': 'rt_div', '//': 'rt_intdiv', '%': 'rt_mod'}
+
+_UNARY_OPS = {'+': '+', '-': '-'}
+
+# Escape sequences in GOX string and char literals (\xHH is handled apart;
+# any other escaped character keeps its backslash)
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0', '\\': '\\', "'": "'", '"': '"'}
+_ESCAPE_RE = re.compile(r'\\(x[0-9a-fA-F]{2}|.)', re.DOTALL)
+
+# Value of a declared variable that has no initializer
+_ZERO_VALUES = {'int': '0', 'float': '0.0', 'bool': 'False', 'char': "'\\x00'", 'string': "''"}
+
+
+def _name(name):
+    return _NAME_PREFIX + name
+
+
+def _unescape(match):
+    escape = match.group(1)
+    if escape[0] == 'x' and len(escape) == 3:
+        return chr(int(escape[1:], 16))
+    return _ESCAPES.get(escape, '\\' + escape)
+
+
+def _literal(lexeme):
+    """Python source for a GOX string or char literal (quotes included)"""
+    return repr(_ESCAPE_RE.sub(_unescape, lexeme[1:-1]))
+
+
+def _float(value):
+    return repr(value) if math.isfinite(value) else f"float({str(value)!r})"
+
+
+def _expr(node):
+    """Python source for a GOX expression"""
+    try:
+        handler = _EXPRESSIONS[type(node)]
+    except KeyError:
+        raise TypeError(f"Cannot compile {type(node).__name__} expression") from None
+    return handler(node)
+
+
+def _binop(node):
+    left, right = _expr(node.left), _expr(node.right)
+    if node.op in _BINARY_HELPERS:
+        return f"{_BINARY_HELPERS[node.op]}({left}, {right})"
+    return f"({left} {_BINARY_OPS[node.op]} {right})"
+
+
+def _unaryop(node):
+    operand = _expr(node.operand)
+    if node.op == '`':
+        # `addr reads one byte of memory
+        return f"rt_memory[{operand}]"
+    if node.op not in _UNARY_OPS:
+        raise TypeError(f"Cannot compile unary operator {node.op!r}")
+    return f"({_UNARY_OPS[node.op]}{operand})"
+
+
+_EXPRESSIONS = {
+    Integer: lambda n: repr(n.value),
+    Float: lambda n: _float(n.value),
+    Boolean: lambda n: repr(bool(n.value)),
+    String: lambda n: _literal(n.value),
+    Char: lambda n: _literal(n.value),
+    BinOp: _binop,
+    UnaryOp: _unaryop,
+    Location: lambda n: _name(n.name),
+    FunctionCall: lambda n: f"{_name(n.name)}({', '.join(_expr(arg) for arg in n.args)})",
+    Dereference: lambda n: f"rt_memory[{_expr(n.location)}]",
+}
+
+
+def _assigned_names(statements, names):
+    """Collect the names assigned anywhere in `statements` (nested blocks included)"""
+    for stmt in statements:
+        if isinstance(stmt, (VariableDecl, ConstantDecl)):
+            names.add(stmt.name)
+        elif isinstance(stmt, Assignment):
+            names.add(stmt.location.name)
+        elif isinstance(stmt, If):
+            _assigned_names(stmt.consequence, names)
+            _assigned_names(stmt.alternative or [], names)
+        elif isinstance(stmt, While):
+            _assigned_names(stmt.body, names)
+    return names
+
+
+def _declared_names(statements, names):
+    """Collect the names declared with var/const in `statements` (nested blocks included)"""
+    for stmt in statements:
+        if isinstance(stmt, (VariableDecl, ConstantDecl)):
+            names.add(stmt.name)
+        elif isinstance(stmt, If):
+            _declared_names(stmt.consequence, names)
+            _declared_names(stmt.alternative or [], names)
+        elif isinstance(stmt, While):
+            _declared_names(stmt.body, names)
+    return names
+
+
+class _Emitter:
+    """Accumulates indented lines of Python source"""
+
+    def __init__(self):
+        self.lines = []
+        self.indent = 0
+
+    def line(self, text):
+        self.lines.append('    ' * self.indent + text)
+
+    def block(self, statements):
+        self.indent += 1
+        if statements:
+            for stmt in statements:
+                self.statement(stmt)
+        else:
+            self.line('pass')
+        self.indent -= 1
+
+    def statement(self, node):
+        try:
+            handler = getattr(self, '_' + type(node).__name__)
+        except AttributeError:
+            raise TypeError(f"Cannot compile {type(node).__name__} statement") from None
+        handler(node)
+
+    def _VariableDecl(self, node):
+        value = _expr(node.value) if node.value is not None else _ZERO_VALUES.get(node.var_type, 'None')
+        self.line(f"{_name(node.name)} = {value}")
+
+    def _ConstantDecl(self, node):
+        self.line(f"{_name(node.name)} = {_expr(node.value)}")
+
+    def _Assignment(self, node):
+        self.line(f"{_name(node.location.name)} = {_expr(node.expr)}")
+
+    def _Print(self, node):
+        self.line(f"rt_print({_expr(node.expr)})")
+
+    def _FunctionCall(self, node):
+        self.line(_expr(node))
+
+    def _Return(self, node):
+        self.line(f"return {_expr(node.expr)}" if node.expr is not None else "return")
+
+    def _If(self, node):
+        self.line(f"if {_expr(node.test)}:")
+        self.block(node.consequence)
+        if node.alternative:
+            self.line("else:")
+            self.block(node.alternative)
+
+    def _While(self, node):
+        self.line(f"while {_expr(node.test)}:")
+        self.block(node.body)
+
+    def _FunctionDecl(self, node):
+        if self.indent:
+            # Only top-level functions exist before main() runs
+            raise TypeError(f"Cannot compile nested function {node.name!r}")
+        params = [param.name for param in node.params]
+        self.line(f"def {_name(node.name)}({', '.join(_name(p) for p in params)}):")
+        local_names = _declared_names(node.body, set(params))
+        outer_names = _assigned_names(node.body, set()) - local_names
+        if outer_names:
+            self.line(f"    global {', '.join(_name(n) for n in sorted(outer_names))}")
+        self.block(node.body)
+
+    def _ImportDecl(self, node):
+        # Module imports carry no code; imported functions come from `env`.
+        pass
+
+    def _FunctionImportDecl(self, node):
+        self.line(f"{_name(node.module_name)} = rt_env[{node.module_name!r}]")
+
+
+def generate(program):
+    """
+    Return Python source defining main(), which runs the top-level
+    statements of `program`. Functions are emitted as module-level defs
+    and top-level variables as module globals.
+    """
+    if not isinstance(program, Program):
+        raise TypeError(f"Expected a Program, got {type(program).__name__}")
+    emitter = _Emitter()
+    functions = [stmt for stmt in program.statements if isinstance(stmt, FunctionDecl)]
+    statements = [stmt for stmt in program.statements if not isinstance(stmt, FunctionDecl)]
+    for func in functions:
+        emitter.statement(func)
+        emitter.line('')
+    emitter.line("def main():")
+    global_names = _assigned_names(statements, set())
+    global_names.update(stmt.module_name for stmt in statements if isinstance(stmt, FunctionImportDecl))
+    if global_names:
+        emitter.line(f"    global {', '.join(_name(n) for n in sorted(global_names))}")
+    emitter.block(statements)
+    return '\n'.join(emitter.lines) + '\n'
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_source(source):
+    return compile(source, '<gox>', 'exec')
+
+
+def rt_div(a, b):
+    if isinstance(a, int) and isinstance(b, int):
+        quotient = abs(a) // abs(b)
+        return quotient if (a < 0) == (b < 0) else -quotient
+    return a / b
+
+
+def rt_intdiv(a, b):
+    if isinstance(a, int) and isinstance(b, int):
+        return rt_div(a, b)
+    return float(math.trunc(a / b))
+
+
+def rt_mod(a, b):
+    if isinstance(a, int) and isinstance(b, int):
+        return a - rt_div(a, b) * b
+    return math.fmod(a, b)
+
+
+def rt_print(value):
+    if isinstance(value, bool):
+        value = 'true' if value else 'false'
+    print(value)
+
+
+def compile_program(program, env=None, memory=None):
+    """
+    Compile `program` (a Program node) and return its main() function.
+    `env` maps the names of imported functions to Python callables and
+    `memory` is the bytearray read by dereferences. Each call gets a fresh
+    namespace; the compiled code object is cached by generated source.
+    """
+    code = _compile_source(generate(program))
+    namespace = {
+        'rt_div': rt_div,
+        'rt_intdiv': rt_intdiv,
+        'rt_mod': rt_mod,
+        'rt_print': rt_print,
+        'rt_env': env if env is not None else {},
+        'rt_memory': memory if memory is not None else bytearray(),
+    }
+    exec(code, namespace)
+    return namespace['main']
+
+
+if __name__ == "__main__":
+    import sys
+    from GOX_error_handler import ErrorHandler
+    from GOX_parser import parse_cached
+
+    if len(sys.argv) < 2:
+        print("Usage: python GOX_codegen.py [filename].gox")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    with open(filename, 'r') as file:
+        code = file.read()
+
+    error_handler = ErrorHandler()
+    program = parse_cached(filename, code, error_handler)
+    if error_handler.has_errors():
+        print(f"Parsing failed for {filename}:")
+        error_handler.report_errors()
+        sys.exit(1)
+    print(generate(program))
@@ -1,5 +1,6 @@
 # GOX_lexer.py
 import re
+from array import array
 
 # Definición de tokens con orden adecuado:
 TOKEN_SPEC = [
@@ -70,27 +71,103 @@ TOKEN_SPEC = [
 
 # Crear la expresión regular combinada a partir de los tokens
 token_regex = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in TOKEN_SPEC)
+token_pattern = re.compile(token_regex, re.DOTALL)
+
+# La misma expresión sobre bytes, para fuentes ASCII: el motor lee un byte por
+# carácter en lugar de pasar por la representación variable de str.
+token_pattern_ascii = re.compile(token_regex.encode('ascii'), re.DOTALL)
+# En str, \s también acepta los separadores ASCII \x1c-\x1f y en bytes no;
+# un texto que los contenga se analiza por el camino de str.
+_STR_ONLY_SPACE = re.compile(r'[\x1c-\x1f]')
+
+# Tipos de token internados como enteros pequeños: TOK.PLUS, TOK.ID, ... (0 es EOF).
+# TOKEN_NAMES[type_id] devuelve el nombre del tipo.
+TOKEN_NAMES = ['EOF'] + [name for name, _ in TOKEN_SPEC if name not in ('COMMENT', 'WHITESPACE', 'MISMATCH')]
+TOKEN_IDS = {name: type_id for type_id, name in enumerate(TOKEN_NAMES)}
+TOK = type('TOK', (), dict(TOKEN_IDS))
+
+# Conversión del lexema de los literales numéricos, hecha una sola vez al
+# analizar el texto.
+NUMERIC_CONVERTERS = {TOK.INTEGER: int, TOK.FLOAT: float}
 
 class Token:
-    def __init__(self, type: str, value: str, lineno: int):
+    __slots__ = ('type', 'value', 'lineno', 'numeric_value')
+
+    def __init__(self, type: str, value: str, lineno: int, numeric_value=None):
         self.type = type
         self.value = value
         self.lineno = lineno
+        self.numeric_value = numeric_value  # int/float de INTEGER y FLOAT
 
     def __repr__(self):
         return f"Token(type='{self.type}', value='{self.value}', lineno={self.lineno})"
 
+class TokenArrays:
+    """
+    Tokens guardados por columnas: tipo (id de TOK), lexema y línea del
+    token i están en type_ids[i], values[i] y linenos[i]. Para los literales
+    INTEGER y FLOAT, numbers[i] guarda además el valor ya convertido.
+    """
+    __slots__ = ('type_ids', 'values', 'linenos', 'numbers')
+
+    def __init__(self):
+        self.type_ids = array('i')
+        self.values = []
+        self.linenos = array('i')
+        self.numbers = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        """Convierte una lista de Token a columnas."""
+        arrays = cls()
+        for i, tok in enumerate(tokens):
+            type_id = TOKEN_IDS[tok.type]
+            arrays.type_ids.append(type_id)
+            arrays.values.append(tok.value)
+            arrays.linenos.append(tok.lineno)
+            if type_id in NUMERIC_CONVERTERS:
+                number = tok.numeric_value
+                if number is None:
+                    number = NUMERIC_CONVERTERS[type_id](tok.value)
+                arrays.numbers[i] = number
+        return arrays
+
+    def to_tokens(self):
+        """Convierte las columnas a una lista de Token."""
+        numbers = self.numbers
+        return [Token(TOKEN_NAMES[type_id], value, lineno, numbers.get(i))
+                for i, (type_id, value, lineno) in enumerate(zip(self.type_ids, self.values, self.linenos))]
+
 def tokenize(text, error_handler):
     """
     Función que recibe un código fuente y retorna una lista de tokens.
     Los tokens se generan utilizando la expresión regular compuesta.
     """
-    tokens = []
+    return scan(text, error_handler).to_tokens()
+
+def scan(text, error_handler):
+    """
+    Igual que tokenize(), pero retorna los tokens como TokenArrays (sin crear
+    un objeto Token por token). Es la entrada que usa el parser.
+    """
+    tokens = TokenArrays()
+    type_ids = tokens.type_ids
+    values = tokens.values
+    linenos = tokens.linenos
+    numbers = tokens.numbers
     lineno = 1
-    # re.finditer nos permite recorrer todas las coincidencias en el texto.
-    for match in re.finditer(token_regex, text, re.DOTALL):
+    if text.isascii() and _STR_ONLY_SPACE.search(text) is None:
+        pattern, subject = token_pattern_ascii, text.encode('ascii')
+    else:
+        pattern, subject = token_pattern, text
+    # finditer nos permite recorrer todas las coincidencias en el texto.
+    for match in pattern.finditer(subject):
         kind = match.lastgroup  # Nombre del token
-        value = match.group()     # Lexema encontrado
+        start, end = match.span()
+        value = text[start:end]   # Lexema encontrado (siempre como str)
         if kind == 'WHITESPACE':
             lineno += value.count('\n')
             continue
@@ -101,7 +178,12 @@ def tokenize(text, error_handler):
         elif kind == 'MISMATCH':
             error_handler.add_error(f"Caracter ilegal '{value}'", lineno)
             continue
-        tokens.append(Token(kind, value, lineno))
+        type_id = TOKEN_IDS[kind]
+        if type_id in NUMERIC_CONVERTERS:
+            numbers[len(values)] = NUMERIC_CONVERTERS[type_id](value)
+        type_ids.append(type_id)
+        values.append(value)
+        linenos.append(lineno)
     return tokens
 
 # Ejemplo de uso del lexer
@@ -1,55 +1,234 @@
 # GOX_Parser.py - GoxLang Parser Implementation
 
-from GOX_lexer import Token, tokenize
+from GOX_lexer import TOK, TOKEN_NAMES, TokenArrays, scan
 from GOX_AST_nodes import Integer, Float, Boolean, String, BinOp, UnaryOp, Location, FunctionCall, Print
 from GOX_AST_nodes import Assignment, If, ConstantDecl, VariableDecl, FunctionDecl, Return, While, Parameter, Program, ImportDecl, FunctionImportDecl, Char, Dereference
 from GOX_error_handler import ErrorHandler
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
-
+import os
+import pickle
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bump when the AST layout changes so stale cache files are ignored.
+AST_CACHE_VERSION = 3
+
+# Top-level statements are serialized across threads only for programs
+# larger than this, and only where threads run Python code in parallel
+# (free-threaded builds): with the GIL, building the dicts serializes them.
+_PARALLEL_MIN_STATEMENTS = 64
+_GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+# Binding power of each binary operator (higher binds tighter); every
+# level is left-associative.
+_BINARY_PREC = {
+    TOK.LOR: 1,
+    TOK.LAND: 2,
+    TOK.LT: 3, TOK.GT: 3, TOK.LE: 3, TOK.GE: 3, TOK.EQ: 3, TOK.NE: 3,
+    TOK.PLUS: 4, TOK.MINUS: 4,
+    TOK.TIMES: 5, TOK.DIVIDE: 5, TOK.MOD: 5, TOK.INT_DIV: 5,
+}
+
+# Membership in a frozenset of ids is cheaper in CPython than a
+# (1 << type_id) & mask test.
+_UNARY_OPS = frozenset((TOK.PLUS, TOK.MINUS, TOK.DEREF))
+
+# Tokens that end a statement block / an import parameter list (EOF included
+# so unterminated input stops there)
+_BLOCK_END = frozenset((TOK.RBRACE, TOK.EOF))
+_PARAMS_END = frozenset((TOK.RPAREN, TOK.EOF))
+
+# Token types accepted as a type name in declarations and signatures
+_TYPE_NAMES = frozenset((TOK.INT, TOK.FLOAT_TYPE, TOK.BOOL, TOK.STRING_TYPE, TOK.CHAR_TYPE, TOK.ID))
+
+# Shared Integer leaves for the most common literal values (nodes are never
+# mutated after parsing, so one instance can appear many times in an AST)
+_SMALL_INTEGERS = {value: Integer(value) for value in range(256)}
+
+# Rule ids for opt-in packrat memoization (see memo_rule)
+RULE_EXPRESSION = 1
+RULE_PRIMARY = 2
+
+
+def memo_rule(rule_id):
+    """
+    Mark a parse rule as memoizable under `rule_id`.
+    The rule is only memoized when `rule_id` is passed in the parser's
+    `memoize_rules`; otherwise it runs unwrapped at no extra cost.
+    """
+    def decorator(method):
+        method.rule_id = rule_id
+        return method
+    return decorator
+
+
+def _serialize(node):
+    """Serialize an AST node (or list of nodes) to JSON-compatible data"""
+    if node is None:
+        return None
+    node_type = type(node)
+    if node_type is list:
+        return [_serialize(item) for item in node]
+    serializer = _SERIALIZERS.get(node_type)
+    if serializer is None:
+        return {"type": node_type.__name__}
+    return serializer(node)
+
+
+# One serializer per AST node class, looked up by exact type
+_SERIALIZERS = {
+    Program: lambda n: {"type": "Program", "statements": _serialize(n.statements)},
+    Integer: lambda n: {"type": "Integer", "value": n.value},
+    Float: lambda n: {"type": "Float", "value": n.value},
+    Boolean: lambda n: {"type": "Boolean", "value": n.value},
+    String: lambda n: {"type": "String", "value": n.value},
+    Char: lambda n: {"type": "Char", "value": n.value},
+    BinOp: lambda n: {"type": "BinOp", "operator": n.op, "left": _serialize(n.left), "right": _serialize(n.right)},
+    UnaryOp: lambda n: {"type": "UnaryOp", "operator": n.op, "operand": _serialize(n.operand)},
+    Location: lambda n: {"type": "Location", "name": n.name},
+    FunctionCall: lambda n: {"type": "FunctionCall", "name": n.name, "arguments": _serialize(n.args)},
+    Print: lambda n: {"type": "Print", "expression": _serialize(n.expr)},
+    Assignment: lambda n: {"type": "Assignment", "target": _serialize(n.location), "value": _serialize(n.expr)},
+    If: lambda n: {"type": "If", "condition": _serialize(n.test), "consequence": _serialize(n.consequence),
+                   "alternative": _serialize(n.alternative)},
+    While: lambda n: {"type": "While", "condition": _serialize(n.test), "body": _serialize(n.body)},
+    # "type" holds the declared type for declarations and parameters
+    VariableDecl: lambda n: {"type": n.var_type, "name": n.name, "initial_value": _serialize(n.value)},
+    ConstantDecl: lambda n: {"type": "ConstantDecl", "name": n.name, "value": _serialize(n.value)},
+    FunctionDecl: lambda n: {"type": "FunctionDecl", "name": n.name, "parameters": _serialize(n.params),
+                             "return_type": n.return_type, "body": _serialize(n.body)},
+    Return: lambda n: {"type": "Return", "value": _serialize(n.expr)},
+    Parameter: lambda n: {"type": n.param_type, "name": n.name},
+    ImportDecl: lambda n: {"type": "ImportDecl", "module_name": n.module_name},
+    FunctionImportDecl: lambda n: {"type": "FunctionImportDecl", "module_name": n.module_name,
+                                   "params": _serialize(n.params), "return_type": n.return_type},
+    Dereference: lambda n: {"type": "Dereference", "location": _serialize(n.location)},
+}
 
 class Parser:
-    def __init__(self, tokens, error_handler):
+    def __init__(self, tokens, error_handler, memoize_rules=frozenset()):
+        # Tokens are read column-wise (see GOX_lexer.TokenArrays); a list of
+        # Token objects is converted on the way in.
+        if not isinstance(tokens, TokenArrays):
+            tokens = TokenArrays.from_tokens(tokens)
         self.tokens = tokens
+        # The columns are copied with an EOF sentinel appended, so there is
+        # always a current token and lookups need no end-of-input check.
+        self.type_ids = array('i', tokens.type_ids)
+        self.type_ids.append(TOK.EOF)
+        self.values = tokens.values + [None]
+        self.linenos = array('i', tokens.linenos)
+        self.linenos.append(0)
+        self.numbers = tokens.numbers
         self.error_handler = error_handler
         self.pos = 0
-        self.current_token = self.tokens[0] if tokens else None
+        # Location nodes are immutable leaves, so one node per name is shared
+        # by every reference to it.
+        self._locations = {}
+
+        # Packrat memoization, one {start_pos: (node, end_pos)} table per rule.
+        # Only worth enabling for rules that are re-entered at the same
+        # position (backtracking); errors reported by the first attempt are
+        # not reported again on a cache hit.
+        self._memo = {}
+        if memoize_rules:
+            for name in dir(type(self)):
+                rule_id = getattr(getattr(type(self), name), 'rule_id', None)
+                if rule_id in memoize_rules:
+                    self._memo[rule_id] = {}
+                    setattr(self, name, self._memoized(getattr(self, name), self._memo[rule_id]))
+
+        # Handlers keyed by the token type that starts each construct
+        self._stmt_dispatch = {
+            TOK.IMPORT: self.parse_import,
+            TOK.VAR: self._parse_declaration_statement,
+            TOK.CONST: self._parse_declaration_statement,
+            TOK.PRINT: self.parse_print,
+            TOK.IF: self.parse_if,
+            TOK.WHILE: self.parse_while,
+            TOK.FUNC: self.parse_function,
+            TOK.RETURN: self.parse_return,
+            TOK.ID: self._parse_id_statement,
+        }
+        self._primary_dispatch = {
+            TOK.INTEGER: self._parse_integer,
+            TOK.FLOAT: self._parse_float,
+            TOK.LPAREN: self._parse_group,
+            TOK.ID: self._parse_name,
+            TOK.TRUE: self._parse_boolean,
+            TOK.FALSE: self._parse_boolean,
+            TOK.STRING: self._parse_string,
+            TOK.CHAR: self._parse_char,
+        }
 
     def advance(self):
         self.pos += 1
-        if self.pos < len(self.tokens):
-            self.current_token = self.tokens[self.pos]
-        else:
-            self.current_token = None
+
+    def seek(self, pos):
+        """Move to an absolute token position"""
+        self.pos = pos
+
+    def _memoized(self, rule, memo):
+        def memoized_rule():
+            start = self.pos
+            entry = memo.get(start)
+            if entry is not None:
+                node, end = entry
+                self.seek(end)
+                return node
+            node = rule()
+            memo[start] = (node, self.pos)
+            return node
+        return memoized_rule
 
     def peek(self, offset=1):
-        """Look ahead at the next token without consuming it"""
+        """Look ahead at the type id of a later token without consuming it"""
         peek_pos = self.pos + offset
-        if peek_pos < len(self.tokens):
-            return self.tokens[peek_pos]
+        if peek_pos < len(self.type_ids):
+            return self.type_ids[peek_pos]
         return None
 
-    def expect(self, token_type, err_msg=None):
-        if self.current_token and self.current_token.type == token_type:
-            token = self.current_token
-            self.advance()
-            return token
+    def lineno(self, pos):
+        """Line of the token at `pos` for error messages"""
+        if self.type_ids[pos] == TOK.EOF:
+            return "End of file"
+        return self.linenos[pos]
+
+    def expect(self, type_id, err_msg=None):
+        """Consume a token of the given type and return its value (False if missing)"""
+        pos = self.pos
+        if self.type_ids[pos] == type_id:
+            self.pos = pos + 1
+            return self.values[pos]
         else:
-            err = err_msg or f"Expected {token_type}"
-            if self.current_token:
-                self.error_handler.add_error(err, self.current_token.lineno)
-            else:
-                self.error_handler.add_error(err, "End of file")
+            err = err_msg or f"Expected {TOKEN_NAMES[type_id]}"
+            self.error(err, pos)
             return False
 
+    def error(self, message, pos):
+        """Report `message` at the line of the token at `pos`"""
+        self.error_handler.add_error(message, self.lineno(pos))
+
     def parse(self):
         """Entry point for parsing the entire program"""
         statements = []
-        while self.current_token:
-            stmt = self.parse_statement()
+        append = statements.append
+        type_ids = self.type_ids
+        parse_statement = self.parse_statement
+        while type_ids[self.pos] != TOK.EOF:
+            stmt = parse_statement()
             if stmt:
-                statements.append(stmt)
-            else:
-                # Skip invalid token to avoid infinite loop.
+                append(stmt)
+            elif type_ids[self.pos] != TOK.EOF:
+                # Skip invalid token to avoid infinite loop (never past the
+                # EOF sentinel, which the bad token may have been right before).
                 self.advance()
         
         # Wrap statements in a Program node to represent the full AST
@@ -57,201 +236,190 @@ class Parser:
 
     def parse_statement(self):
         """Parse a single statement"""
-        if not self.current_token:
+        type_id = self.type_ids[self.pos]
+        handler = self._stmt_dispatch.get(type_id)
+        if handler:
+            return handler()
+        if type_id == TOK.EOF:
             return None
+        self.error(f"Unexpected token type: {TOKEN_NAMES[type_id]}", self.pos)
+        self.advance()
+        return None
+
+    def _parse_declaration_statement(self):
+        stmt = self.parse_declaration()
+        # Si la gramática requiere ';' al final de la declaración
+        self.expect(TOK.SEMI, "Missing ';' after declaration")
+        return stmt
 
-        # Añadir el caso para importar módulos
-        if self.current_token.type == 'IMPORT':
-            return self.parse_import()
-        elif self.current_token.type in ['VAR', 'CONST']:
-            stmt = self.parse_declaration()
-            # Si la gramática requiere ';' al final de la declaración
-            self.expect('SEMI', "Missing ';' after declaration")
-            return stmt
-        elif self.current_token.type == 'PRINT':
-            return self.parse_print()
-        elif self.current_token.type == 'IF':
-            return self.parse_if()
-        elif self.current_token.type == 'WHILE':
-            return self.parse_while()
-        elif self.current_token.type == 'FUNC':
-            return self.parse_function()
-        elif self.current_token.type == 'RETURN':
-            return self.parse_return()
-        elif self.current_token.type == 'ID':
-            # Chequear si es llamada a función o asignación
-            if self.peek() and self.peek().type == 'LPAREN':
-                return self.parse_function_call()
-            else:
-                return self.parse_assignment()
+    def _parse_id_statement(self):
+        # Chequear si es llamada a función o asignación
+        if self.peek() == TOK.LPAREN:
+            return self.parse_function_call()
         else:
-            self.error_handler.add_error(
-                f"Unexpected token type: {self.current_token.type}", 
-                self.current_token.lineno
-            )
-            self.advance()
-            return None
+            return self.parse_assignment()
 
+    @memo_rule(RULE_EXPRESSION)
     def parse_expression(self):
-        return self.parse_logic_or()
-
-    def parse_logic_or(self):
-        node = self.parse_logic_and()
-        while self.current_token and self.current_token.type == 'LOR':
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_logic_and()
-            node = BinOp(op, node, right)
-        return node
+        return self.parse_binop(1)
 
-    def parse_logic_and(self):
-        node = self.parse_comparison()
-        while self.current_token and self.current_token.type == 'LAND':
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_comparison()
-            node = BinOp(op, node, right)
-        return node
-
-    def parse_comparison(self):
-        node = self.parse_term()
-        while self.current_token and self.current_token.type in ['LT', 'GT', 'LE', 'GE', 'EQ', 'NE']:
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_term()
-            node = BinOp(op, node, right)
-        return node
-
-    def parse_term(self):
-        node = self.parse_factor()
-        while self.current_token and self.current_token.type in ['PLUS', 'MINUS']:
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_factor()
-            node = BinOp(op, node, right)
-        return node
-
-    def parse_factor(self):
+    def parse_binop(self, min_prec):
+        """Parse binary operators binding at least as tight as `min_prec`"""
         node = self.parse_unary()
-        while self.current_token and self.current_token.type in ['TIMES', 'DIVIDE', 'MOD', 'INT_DIV']:
-            op = self.current_token.value
-            self.advance()
-            right = self.parse_unary()
-            node = BinOp(op, node, right)
+        type_ids = self.type_ids
+        pos = self.pos
+        prec = _BINARY_PREC.get(type_ids[pos], 0)
+        while prec >= min_prec:
+            self.pos = pos + 1
+            node = BinOp(self.values[pos], node, self.parse_binop(prec + 1))
+            pos = self.pos
+            prec = _BINARY_PREC.get(type_ids[pos], 0)
         return node
 
     def parse_unary(self):
-        if self.current_token and self.current_token.type in ['PLUS', 'MINUS', 'NOT', 'DEREF']:
-            op = self.current_token.value
+        pos = self.pos
+        if self.type_ids[pos] in _UNARY_OPS:
+            op = self.values[pos]
             self.advance()
-            if self.current_token.type == 'DEREF':
+            if self.type_ids[self.pos] == TOK.DEREF:
                 return Dereference(self.parse_primary())
             return UnaryOp(op, self.parse_primary())
         return self.parse_primary()
 
+    @memo_rule(RULE_PRIMARY)
     def parse_primary(self):
-        token = self.current_token
-        if token.type == 'INTEGER':
+        pos = self.pos
+        handler = self._primary_dispatch.get(self.type_ids[pos])
+        if handler:
+            return handler(pos)
+        self.error("Invalid expression", pos)
+        if self.type_ids[pos] != TOK.EOF:
             self.advance()
-            return Integer(int(token.value))
-        elif token.type == 'FLOAT':
-            self.advance()
-            return Float(float(token.value))
-        elif token.type == 'LPAREN':
-            self.advance()
-            expr = self.parse_expression()
-            self.expect('RPAREN', "Missing closing parenthesis")
-            return expr
-        elif token.type == 'ID':
-            self.advance()
-            node = Location(token.value)
-            if self.current_token and self.current_token.type == 'LPAREN':
-                # Llamada a función
-                self.advance()  # Consume LPAREN
-                args = []
-                if self.current_token.type != 'RPAREN':
+        return None
+
+    def _parse_integer(self, pos):
+        self.advance()
+        number = self.numbers[pos]
+        node = _SMALL_INTEGERS.get(number)
+        if node is None:
+            node = Integer(number)
+        return node
+
+    def _parse_float(self, pos):
+        self.advance()
+        return Float(self.numbers[pos])
+
+    def _parse_group(self, pos):
+        self.advance()
+        expr = self.parse_expression()
+        self.expect(TOK.RPAREN, "Missing closing parenthesis")
+        return expr
+
+    def _parse_name(self, pos):
+        self.advance()
+        name = self.values[pos]
+        if self.type_ids[self.pos] == TOK.LPAREN:
+            # Llamada a función
+            self.advance()  # Consume LPAREN
+            args = []
+            if self.type_ids[self.pos] != TOK.RPAREN:
+                args.append(self.parse_expression())
+                while self.type_ids[self.pos] == TOK.COMMA:
+                    self.advance()
                     args.append(self.parse_expression())
-                    while self.current_token and self.current_token.type == 'COMMA':
-                        self.advance()
-                        args.append(self.parse_expression())
-                self.expect('RPAREN', "Expected ')' after function arguments")
-                node = FunctionCall(token.value, args)
-            return node
-        elif token.type in ['TRUE', 'FALSE']:
-            self.advance()
-            return Boolean(token.value.lower() == 'true')
-        elif token.type == 'STRING':
-            self.advance()
-            return String(token.value)
-        elif token.type == 'CHAR':
-            self.advance()
-            return Char(token.value)
-        else:
-            self.error_handler.add_error("Invalid expression", token.lineno)
-            self.advance()
-            return None
+            self.expect(TOK.RPAREN, "Expected ')' after function arguments")
+            return FunctionCall(name, args)
+        return self._location(name)
+
+    def _location(self, name):
+        node = self._locations.get(name)
+        if node is None:
+            node = self._locations[name] = Location(name)
+        return node
+
+    def _parse_boolean(self, pos):
+        self.advance()
+        return Boolean(self.values[pos].lower() == 'true')
+
+    def _parse_string(self, pos):
+        self.advance()
+        return String(self.values[pos])
+
+    def _parse_char(self, pos):
+        self.advance()
+        return Char(self.values[pos])
+
+    def _parse_type(self):
+        """Consume an optional type name and return it (None if absent)"""
+        pos = self.pos
+        if self.type_ids[pos] in _TYPE_NAMES:
+            self.pos = pos + 1
+            return self.values[pos]
+        return None
 
     def parse_location(self):
-        ident = self.current_token.value
-        self.expect('ID')
-        return Location(ident)
+        ident = self.values[self.pos]
+        self.expect(TOK.ID)
+        return self._location(ident)
 
     def parse_print(self):
-        self.expect('PRINT')
+        self.expect(TOK.PRINT)
         expr = self.parse_expression()
-        self.expect('SEMI', "Missing ';' after print statement")
+        self.expect(TOK.SEMI, "Missing ';' after print statement")
         return Print(expr)
 
+    def _parse_block(self):
+        """Parse statements up to the closing '}' (or EOF) of a block"""
+        body = []
+        append = body.append
+        type_ids = self.type_ids
+        parse_statement = self.parse_statement
+        while type_ids[self.pos] not in _BLOCK_END:
+            append(parse_statement())
+        return body
+
     def parse_assignment(self):
         location = self.parse_location()
-        self.expect('ASSIGN', "Missing '=' in assignment")
+        self.expect(TOK.ASSIGN, "Missing '=' in assignment")
         expr = self.parse_expression()
-        self.expect('SEMI', "Missing ';' after assignment")
+        self.expect(TOK.SEMI, "Missing ';' after assignment")
         return Assignment(location, expr)
 
     def parse_if(self):
-        self.expect('IF')
+        self.expect(TOK.IF)
         test = self.parse_expression()
-        self.expect('LBRACE', "Missing '{' after if condition")
-        consequence = []
-        while self.current_token and self.current_token.type != 'RBRACE':
-            consequence.append(self.parse_statement())
-        self.expect('RBRACE', "Missing '}' at the end of if block")
+        self.expect(TOK.LBRACE, "Missing '{' after if condition")
+        consequence = self._parse_block()
+        self.expect(TOK.RBRACE, "Missing '}' at the end of if block")
         
         alternative = []
-        if self.current_token and self.current_token.type == 'ELSE':
+        if self.type_ids[self.pos] == TOK.ELSE:
             self.advance()
-            self.expect('LBRACE', "Missing '{' after else")
-            while self.current_token and self.current_token.type != 'RBRACE':
-                alternative.append(self.parse_statement())
-            self.expect('RBRACE', "Missing '}' at the end of else block")
+            self.expect(TOK.LBRACE, "Missing '{' after else")
+            alternative = self._parse_block()
+            self.expect(TOK.RBRACE, "Missing '}' at the end of else block")
         return If(test, consequence, alternative)
 
     def parse_while(self):
-        self.expect('WHILE')
+        self.expect(TOK.WHILE)
         test = self.parse_expression()
-        self.expect('LBRACE', "Missing '{' after while condition")
-        body = []
-        while self.current_token and self.current_token.type != 'RBRACE':
-            body.append(self.parse_statement())
-        self.expect('RBRACE', "Missing '}' at the end of while block")
+        self.expect(TOK.LBRACE, "Missing '{' after while condition")
+        body = self._parse_block()
+        self.expect(TOK.RBRACE, "Missing '}' at the end of while block")
         return While(test, body)
 
     def parse_declaration(self):
-        is_const = self.current_token.type == 'CONST'
+        is_const = self.type_ids[self.pos] == TOK.CONST
         self.advance()
-        ident = self.expect('ID', "Expected identifier in declaration").value
+        ident = self.expect(TOK.ID, "Expected identifier in declaration")
         
         # Add proper type handling
-        var_type = None
-        if self.current_token and self.current_token.type in ['INT', 'FLOAT_TYPE', 'BOOL', 'STRING_TYPE', 'CHAR_TYPE', 'ID']:
-            var_type = self.current_token.value
-            self.advance()
+        var_type = self._parse_type()
         
-        self.expect('ASSIGN', "Expected '=' in declaration")
+        self.expect(TOK.ASSIGN, "Expected '=' in declaration")
         value = self.parse_expression()
         
-        self.expect('SEMI', "Missing ';' after declaration")
+        self.expect(TOK.SEMI, "Missing ';' after declaration")
         
         if is_const:
             return ConstantDecl(ident, value)
@@ -259,201 +427,223 @@ class Parser:
             return VariableDecl(ident, var_type, value)
 
     def parse_function_call(self):
-        name = self.current_token.value  # Se asume que es una llamada a función
-        self.expect('ID', "Expected function name")
-        self.expect('LPAREN', "Expected '(' after function name")
+        name = self.values[self.pos]  # Se asume que es una llamada a función
+        self.expect(TOK.ID, "Expected function name")
+        self.expect(TOK.LPAREN, "Expected '(' after function name")
         args = []
-        if self.current_token.type != 'RPAREN':
+        if self.type_ids[self.pos] != TOK.RPAREN:
             args.append(self.parse_expression())
-            while self.current_token and self.current_token.type == 'COMMA':
+            while self.type_ids[self.pos] == TOK.COMMA:
                 self.advance()
                 args.append(self.parse_expression())
-        self.expect('RPAREN', "Expected ')' after function arguments")
-        self.expect('SEMI', "Missing ';' after function call")
+        self.expect(TOK.RPAREN, "Expected ')' after function arguments")
+        self.expect(TOK.SEMI, "Missing ';' after function call")
         return FunctionCall(name, args)
 
     def parse_function(self):
-        self.expect('FUNC')
-        name = self.expect('ID', "Expected function name after FUNC keyword").value
-        self.expect('LPAREN', "Expected '(' after function name in declaration")
+        self.expect(TOK.FUNC)
+        name = self.expect(TOK.ID, "Expected function name after FUNC keyword")
+        self.expect(TOK.LPAREN, "Expected '(' after function name in declaration")
         params = []
-        if self.current_token.type != 'RPAREN':
-            param_name = self.expect('ID', "Expected parameter name").value
+        if self.type_ids[self.pos] != TOK.RPAREN:
+            param_name = self.expect(TOK.ID, "Expected parameter name")
             
             # Handle parameter type
-            param_type = None
-            if self.current_token and self.current_token.type in ['INT', 'FLOAT_TYPE', 'BOOL', 'STRING_TYPE', 'CHAR_TYPE', 'ID']:
-                param_type = self.current_token.value
-                self.advance()
+            param_type = self._parse_type()
             
             params.append(Parameter(param_name, param_type))
-            while self.current_token and self.current_token.type == 'COMMA':
+            while self.type_ids[self.pos] == TOK.COMMA:
                 self.advance()
-                param_name = self.expect('ID', "Expected parameter name").value
+                param_name = self.expect(TOK.ID, "Expected parameter name")
                 
                 # Handle parameter type
-                param_type = None
-                if self.current_token and self.current_token.type in ['INT', 'FLOAT_TYPE', 'BOOL', 'STRING_TYPE', 'CHAR_TYPE', 'ID']:
-                    param_type = self.current_token.value
-                    self.advance()
+                param_type = self._parse_type()
                 
                 params.append(Parameter(param_name, param_type))
-        self.expect('RPAREN', "Expected ')' after parameters in function declaration")
+        self.expect(TOK.RPAREN, "Expected ')' after parameters in function declaration")
         
         # Handle return type
-        return_type = None
-        if self.current_token and self.current_token.type in ['INT', 'FLOAT_TYPE', 'BOOL', 'STRING_TYPE', 'CHAR_TYPE', 'ID']:
-            return_type = self.current_token.value
-            self.advance()
+        return_type = self._parse_type()
         
-        self.expect('LBRACE', "Expected '{' to start function body")
-        body = []
-        while self.current_token and self.current_token.type != 'RBRACE':
-            body.append(self.parse_statement())
-        self.expect('RBRACE', "Expected '}' to end function body")
+        self.expect(TOK.LBRACE, "Expected '{' to start function body")
+        body = self._parse_block()
+        self.expect(TOK.RBRACE, "Expected '}' to end function body")
         return FunctionDecl(name, params, return_type, body)
 
     def parse_return(self):
-        self.expect('RETURN')
+        self.expect(TOK.RETURN)
         expr = self.parse_expression()
-        self.expect('SEMI', "Missing ';' after return statement")
+        self.expect(TOK.SEMI, "Missing ';' after return statement")
         return Return(expr)
 
     def parse_import(self):
         """Parse an import declaration"""
-        self.expect('IMPORT')
+        self.expect(TOK.IMPORT)
         
         # Check if it's a function import
         is_func_import = False
-        if self.current_token and self.current_token.type == 'FUNC':
+        if self.type_ids[self.pos] == TOK.FUNC:
             is_func_import = True
             self.advance()
         
-        module_name = self.expect('ID', "Expected module name after IMPORT").value
+        module_name = self.expect(TOK.ID, "Expected module name after IMPORT")
         
         # If it's a function import, parse the signature
         if is_func_import:
-            self.expect('LPAREN', "Expected '(' after function name in import")
+            self.expect(TOK.LPAREN, "Expected '(' after function name in import")
             params = []
             
             # Parse parameters
-            while self.current_token and self.current_token.type != 'RPAREN':
-                param_name = self.expect('ID', "Expected parameter name").value
+            while self.type_ids[self.pos] not in _PARAMS_END:
+                param_name = self.expect(TOK.ID, "Expected parameter name")
+                if param_name is False:
+                    break
                 
                 # Handle parameter type
-                param_type = None
-                if self.current_token and self.current_token.type in ['INT', 'FLOAT_TYPE', 'BOOL', 'STRING_TYPE', 'CHAR_TYPE', 'ID']:
-                    param_type = self.current_token.value
-                    self.advance()
+                param_type = self._parse_type()
                 
                 params.append(Parameter(param_name, param_type))
                 
-                if self.current_token.type == 'COMMA':
+                if self.type_ids[self.pos] == TOK.COMMA:
                     self.advance()
             
-            self.expect('RPAREN', "Expected ')' after parameters in import")
+            self.expect(TOK.RPAREN, "Expected ')' after parameters in import")
             
             # Handle return type
-            return_type = None
-            if self.current_token and self.current_token.type in ['INT', 'FLOAT_TYPE', 'BOOL', 'STRING_TYPE', 'CHAR_TYPE', 'ID']:
-                return_type = self.current_token.value
-                self.advance()
+            return_type = self._parse_type()
             
-            self.expect('SEMI', "Missing ';' after import declaration")
+            self.expect(TOK.SEMI, "Missing ';' after import declaration")
             return FunctionImportDecl(module_name, params, return_type)
         else:
-            self.expect('SEMI', "Missing ';' after import declaration")
+            self.expect(TOK.SEMI, "Missing ';' after import declaration")
             return ImportDecl(module_name)
 
-    def to_json(self):
-        """Convert the AST to JSON format"""
-        ast = self.parse()
+    def to_json(self, ast=None):
+        """Convert the AST to JSON format (parsing first if no AST is given)"""
+        if ast is None:
+            ast = self.parse()
         if self.error_handler.has_errors():
             return {"errors": self.error_handler.errors}
         return self._serialize_ast(ast)
 
     def _serialize_ast(self, node):
         """Helper to serialize AST nodes to JSON-compatible dictionaries"""
-        if node is None:
-            return None
-        if isinstance(node, list):
-            return [self._serialize_ast(item) for item in node]
-
-        data = {"type": node.__class__.__name__}
-        if isinstance(node, Program):
-            data["statements"] = self._serialize_ast(node.statements)
-        elif isinstance(node, Integer):
-            data["value"] = node.value
-        elif isinstance(node, Float):
-            data["value"] = node.value
-        elif isinstance(node, Boolean):
-            data["value"] = node.value
-        elif isinstance(node, String):
-            data["value"] = node.value
-        elif isinstance(node, Char):
-            data["value"] = node.value
-        elif isinstance(node, BinOp):
-            data["operator"] = node.op
-            data["left"] = self._serialize_ast(node.left)
-            data["right"] = self._serialize_ast(node.right)
-        elif isinstance(node, UnaryOp):
-            data["operator"] = node.op
-            data["operand"] = self._serialize_ast(node.operand)
-        elif isinstance(node, Location):
-            data["name"] = node.name
-        elif isinstance(node, FunctionCall):
-            data["name"] = node.name
-            data["arguments"] = self._serialize_ast(node.args)
-        elif isinstance(node, Print):
-            data["expression"] = self._serialize_ast(node.expr)
-        elif isinstance(node, Assignment):
-            data["target"] = self._serialize_ast(node.location)
-            data["value"] = self._serialize_ast(node.expr)
-        elif isinstance(node, If):
-            data["condition"] = self._serialize_ast(node.test)
-            data["consequence"] = self._serialize_ast(node.consequence)
-            data["alternative"] = self._serialize_ast(node.alternative)
-        elif isinstance(node, While):
-            data["condition"] = self._serialize_ast(node.test)
-            data["body"] = self._serialize_ast(node.body)
-        elif isinstance(node, VariableDecl):
-            data["name"] = node.name
-            data["type"] = node.var_type
-            data["initial_value"] = self._serialize_ast(node.value)
-        elif isinstance(node, ConstantDecl):
-            data["name"] = node.name
-            data["value"] = self._serialize_ast(node.value)
-        elif isinstance(node, FunctionDecl):
-            data["name"] = node.name
-            data["parameters"] = self._serialize_ast(node.params)
-            data["return_type"] = node.return_type
-            data["body"] = self._serialize_ast(node.body)
-        elif isinstance(node, Return):
-            data["value"] = self._serialize_ast(node.expr)
-        elif isinstance(node, Parameter):
-            data["name"] = node.name
-            data["type"] = node.param_type
-        elif isinstance(node, ImportDecl):
-            data["module_name"] = node.module_name
-        elif isinstance(node, FunctionImportDecl):
-            data["module_name"] = node.module_name
-            data["params"] = self._serialize_ast(node.params)
-            data["return_type"] = node.return_type
-        elif isinstance(node, Dereference):
-            data["location"] = self._serialize_ast(node.location)
-        return data
-
-    def save_ast_to_json(self, filename="ast_oGOXut.json"):
+        return _serialize(node)
+
+    def save_ast_to_json(self, filename="ast_oGOXut.json", ast=None):
         """Save the AST to a JSON file"""
-        ast_json = self.to_json()
-        with open(filename, 'w') as f:
-            json.dump(ast_json, f, indent=2)
+        if ast is None:
+            ast = self.parse()
+        if isinstance(ast, Program) and not self.error_handler.has_errors():
+            return write_ast_json(ast, filename)
+        ast_json = self.to_json(ast)
+        with open(filename, 'wb') as f:
+            f.write(_dumps(ast_json))
         return ast_json
 
 
+def write_ast_json(program, filename):
+    """Save an error-free Program to a JSON file; returns the JSON data"""
+    ast_json, data = _dumps_program(program)
+    with open(filename, 'wb') as f:
+        f.write(data)
+    return ast_json
+
+
+def _dumps(data):
+    """
+    Encode JSON data as indented UTF-8 bytes, with orjson when available.
+    The two encoders produce equivalent but not byte-identical JSON: orjson
+    writes non-ASCII text as UTF-8 instead of \\u escapes, and float
+    exponents without '+' or padding (1e16, 1e-7 instead of 1e+16, 1e-07).
+    A float literal too large for a double (infinity) is written as null by
+    orjson and as Infinity (not valid JSON) by the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects some values (e.g. integers wider than 64 bits)
+            pass
+    return json.dumps(data, indent=2).encode()
+
+
+def _dumps_program(program):
+    """Serialize a Program and encode it with _dumps(); returns (data, bytes)"""
+    statements = program.statements
+    workers = os.cpu_count() or 1
+    if (orjson is not None and not _GIL_ENABLED and workers > 1
+            and len(statements) > _PARALLEL_MIN_STATEMENTS):
+        try:
+            return _dumps_program_parallel(statements, workers)
+        except TypeError:
+            # orjson rejected a value; encode the whole document below
+            pass
+    data = _serialize(program)
+    return data, _dumps(data)
+
+
+def _encode_statements(statements):
+    items = _serialize(statements)
+    return items, [orjson.dumps(item, option=orjson.OPT_INDENT_2) for item in items]
+
+
+def _dumps_program_parallel(statements, workers):
+    """
+    Serialize and encode chunks of top-level statements in a thread pool
+    and splice the fragments into the Program envelope. The bytes match
+    _dumps() on the whole document.
+    """
+    size = -(-len(statements) // workers)
+    chunks = [statements[i:i + size] for i in range(0, len(statements), size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        parts = list(pool.map(_encode_statements, chunks))
+    items = []
+    fragments = []
+    for chunk_items, chunk_fragments in parts:
+        items.extend(chunk_items)
+        # Re-indent each statement to its depth inside "statements" (JSON
+        # strings escape newlines, so every raw newline is layout)
+        fragments.extend(b'    ' + fragment.replace(b'\n', b'\n    ') for fragment in chunk_fragments)
+    data = b'{\n  "type": "Program",\n  "statements": [\n' + b',\n'.join(fragments) + b'\n  ]\n}'
+    return {"type": "Program", "statements": items}, data
+
+
+def parse_cached(filename, code, error_handler):
+    """
+    Parse `code` (the contents of `filename`) into a Program.
+    The AST is pickled to __pycache__/<filename>.ast.pickle next to the
+    source, after a SHA-256 header of the code, so unchanged files skip
+    lexing and parsing. Only error-free ASTs are cached.
+    """
+    digest = hashlib.sha256(f"{AST_CACHE_VERSION}:{code}".encode('utf-8')).digest()
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(filename)), '__pycache__')
+    cache_file = os.path.join(cache_dir, os.path.basename(filename) + '.ast.pickle')
+
+    try:
+        with open(cache_file, 'rb') as f:
+            # The header is compared first, so a stale or foreign cache file
+            # is never unpickled.
+            if f.read(len(digest)) == digest:
+                return pickle.load(f)
+    except Exception:
+        # Missing, unreadable or outdated cache: parse from scratch.
+        pass
+
+    tokens = scan(code, error_handler)
+    ast = Parser(tokens, error_handler).parse()
+    if not error_handler.has_errors():
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                f.write(digest)
+                pickle.dump(ast, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    return ast
+
+
 if __name__ == "__main__":
-    import sys
-    
     # Check if file argument is provided
     if len(sys.argv) < 2:
         print("Usage: python GOX_parser.py [filename].gox")
@@ -472,11 +662,9 @@ if __name__ == "__main__":
         with open(filename, 'r') as file:
             code = file.read()
         
-        # Create error handler and parse the code
+        # Create error handler and parse the code (reusing the cached AST if unchanged)
         error_handler = ErrorHandler()
-        tokens = tokenize(code, error_handler)
-        parser = Parser(tokens, error_handler)
-        ast = parser.parse()
+        ast = parse_cached(filename, code, error_handler)
         
         # Generate output filename (replace .gox with .json)
         output_filename = filename.rsplit('.', 1)[0] + '.json'
@@ -488,7 +676,7 @@ if __name__ == "__main__":
             sys.exit(1)
         else:
             print(f"Successfully parsed {filename}")
-            parser.save_ast_to_json(output_filename)
+            write_ast_json(ast, output_filename)
             print(f"AST saved to {output_filename}")
     
     except FileNotFoundError:
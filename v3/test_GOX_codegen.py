@@ -0,0 +1,106 @@
+import contextlib
+import io
+import unittest
+from GOX_lexer import scan
+from GOX_parser import Parser
+from GOX_error_handler import ErrorHandler
+from GOX_codegen import generate, compile_program, _compile_source
+from GOX_AST_nodes import Program, Print, UnaryOp, Integer
+
+def parse(code):
+    error_handler = ErrorHandler()
+    program = Parser(scan(code, error_handler), error_handler).parse()
+    if error_handler.has_errors():
+        raise AssertionError(error_handler.errors)
+    return program
+
+def run(code, **kwargs):
+    """Compile and run `code`; returns the printed lines"""
+    main = compile_program(parse(code), **kwargs)
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        main()
+    return out.getvalue().splitlines()
+
+class TestGenerate(unittest.TestCase):
+    def test_top_level_statements(self):
+        source = generate(parse("var x int = 1 + 2;; print x;"))
+        self.assertEqual(source, "def main():\n"
+                                 "    global g_x\n"
+                                 "    g_x = (1 + 2)\n"
+                                 "    rt_print(g_x)\n")
+
+    def test_function_assigning_a_global(self):
+        source = generate(parse("var n int = 0;; func bump(k int) int { var t int = k;; n = n + t; return n; }"))
+        self.assertIn("def g_bump(g_k):\n    global g_n\n    g_t = g_k\n", source)
+
+    def test_unsupported_unary_operator(self):
+        with self.assertRaises(TypeError):
+            generate(Program([Print(UnaryOp('!', Integer(1)))]))
+
+    def test_nested_function_is_rejected(self):
+        code = "func outer() int { if 1 < 2 { func inner() int { return 1; } } return inner(); }"
+        with self.assertRaises(TypeError):
+            generate(parse(code))
+
+    def test_not_a_program(self):
+        with self.assertRaises(TypeError):
+            generate([])
+
+class TestCompileProgram(unittest.TestCase):
+    def test_arithmetic(self):
+        self.assertEqual(run("print 1 + 2 * 3; print 7.0 / 2; print 1 < 2;"), ["7", "3.5", "true"])
+
+    def test_division_truncates_toward_zero(self):
+        lines = run("print (0-7) / 2; print (0-7) // 2; print (0-7) % 2; print (0.0-7.5) // 2;")
+        self.assertEqual(lines, ["-3", "-3", "-1", "-3.0"])
+
+    def test_functions_and_loops(self):
+        code = """
+        var calls int = 0;;
+        func fib(n int) int {
+            calls = calls + 1;
+            if n < 2 { return n; }
+            return fib(n - 1) + fib(n - 2);
+        }
+        func count(n int) int {
+            var total int = 0;;
+            while n > 0 { total = total + n; n = n - 1; }
+            return total;
+        }
+        print fib(10);
+        print calls;
+        print count(4);
+        """
+        self.assertEqual(run(code), ["55", "177", "10"])
+
+    def test_strings_and_chars(self):
+        self.assertEqual(run("print \"a\\tb\"; print 'c';"), ["a\tb", "c"])
+        # A bare quote is a valid char literal for the lexer
+        self.assertEqual(run("print ''';"), ["'"])
+        self.assertEqual(run("print \"\\x41\"; print '\\'';"), ["A", "'"])
+        self.assertEqual(run("print \"say \\\"hi\\\" \\q\";"), ['say "hi" \\q'])
+
+    def test_imported_function(self):
+        calls = []
+        run("import func put(a int) int; put(40 + 2);", env={'put': calls.append})
+        self.assertEqual(calls, [42])
+
+    def test_memory_read(self):
+        self.assertEqual(run("var a int = 2;; print `a;", memory=bytearray(b"\x00\x00\x07")), ["7"])
+
+    def test_fresh_namespace_per_compile(self):
+        program = parse("var x int = 5;; print x;")
+        first = compile_program(program)
+        second = compile_program(program)
+        self.assertIsNot(first.__globals__, second.__globals__)
+
+    def test_code_object_is_cached(self):
+        program = parse("print 12345;")
+        compile_program(program)
+        hits = _compile_source.cache_info().hits
+        compile_program(program)
+        self.assertEqual(_compile_source.cache_info().hits, hits + 1)
+
+if __name__ == "__main__":
+    unittest.main()
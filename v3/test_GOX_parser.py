@@ -0,0 +1,186 @@
+import json
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from unittest import mock
+from GOX_lexer import scan
+from GOX_parser import Parser, parse_cached, write_ast_json, RULE_EXPRESSION, RULE_PRIMARY
+from GOX_parser import orjson, _dumps, _dumps_program_parallel, _serialize
+from GOX_error_handler import ErrorHandler
+
+def parse(code):
+    error_handler = ErrorHandler()
+    ast = Parser(scan(code, error_handler), error_handler).parse()
+    messages = [error['message'] for error in error_handler.errors]
+    return ast, messages
+
+class TestParserRecovery(unittest.TestCase):
+    def test_missing_identifier_is_reported(self):
+        # expect() used to return None here and the caller crashed reading .value
+        ast, messages = parse("var = 1;; print 2;")
+        self.assertEqual(messages, ["Expected identifier in declaration"])
+        self.assertEqual(repr(ast.statements[1]), "Print(Integer(2))")
+
+    def test_missing_function_name_is_reported(self):
+        ast, messages = parse("func (a int) int { return a; } print 3;")
+        self.assertEqual(messages, ["Expected function name after FUNC keyword"])
+        self.assertEqual(repr(ast.statements[1]), "Print(Integer(3))")
+
+    def test_missing_import_parameter_name_stops(self):
+        ast, messages = parse("import func f(int, b int) int; print 1;")
+        self.assertEqual(messages[0], "Expected parameter name")
+        self.assertEqual(repr(ast.statements[-1]), "Print(Integer(1))")
+
+class TestParserEndOfInput(unittest.TestCase):
+    def test_stray_last_token(self):
+        for code, token_type in [("}", "RBRACE"), ("-", "MINUS"), ("print 1; )", "RPAREN")]:
+            with self.subTest(code=code):
+                ast, messages = parse(code)
+                self.assertEqual(messages, [f"Unexpected token type: {token_type}"])
+
+    def test_truncated_expression(self):
+        ast, messages = parse("x = 1 +")
+        self.assertIn("Invalid expression", messages)
+
+    def test_unterminated_block(self):
+        ast, messages = parse("while 1 { print 1;")
+        self.assertEqual(messages, ["Missing '}' at the end of while block"])
+        self.assertEqual(repr(ast), "Program([While(Integer(1), [Print(Integer(1))])])")
+
+    def test_end_of_file_line(self):
+        error_handler = ErrorHandler()
+        Parser(scan("print 1", error_handler), error_handler).parse()
+        self.assertEqual(error_handler.errors[0]['lineno'], "End of file")
+
+# Fragments for random (mostly invalid) programs
+_FRAGMENTS = ["var", "const", "x", "y", "f", "=", ";", "1", "2.5", "+", "-", "*", "/", "<", "&&", "||",
+              "(", ")", "{", "}", ",", "if", "else", "while", "func", "return", "print", "import",
+              "int", "`", "true", "'c'", '"s"']
+
+class TestMemoization(unittest.TestCase):
+    def parse_with(self, code, memoize_rules):
+        error_handler = ErrorHandler()
+        parser = Parser(scan(code, error_handler), error_handler, memoize_rules=memoize_rules)
+        return repr(parser.parse()), error_handler.errors
+
+    def test_same_result_as_unmemoized(self):
+        rng = random.Random(11)
+        for _ in range(5000):
+            code = " ".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, 20)))
+            expected = self.parse_with(code, frozenset())
+            for rules in ({RULE_EXPRESSION}, {RULE_PRIMARY}, {RULE_EXPRESSION, RULE_PRIMARY}):
+                self.assertEqual(self.parse_with(code, rules), expected, (code, rules))
+
+    def test_rules_are_wrapped_only_when_requested(self):
+        error_handler = ErrorHandler()
+        plain = Parser(scan("1;", error_handler), error_handler)
+        memoized = Parser(scan("1;", error_handler), error_handler, memoize_rules={RULE_EXPRESSION})
+        self.assertNotIn("parse_expression", vars(plain))
+        self.assertIn("parse_expression", vars(memoized))
+        self.assertNotIn("parse_primary", vars(memoized))
+
+    def test_cache_hit_returns_node_and_end(self):
+        error_handler = ErrorHandler()
+        parser = Parser(scan("1 + 2 * x ;", error_handler), error_handler, memoize_rules={RULE_EXPRESSION})
+        first = parser.parse_expression()
+        end = parser.pos
+        self.assertEqual(end, 5)
+        parser.seek(0)
+        second = parser.parse_expression()
+        self.assertIs(second, first)
+        self.assertEqual(parser.pos, end)
+
+    def test_cache_hit_does_not_repeat_errors(self):
+        error_handler = ErrorHandler()
+        parser = Parser(scan("1 + ;", error_handler), error_handler, memoize_rules={RULE_EXPRESSION})
+        parser.parse_expression()
+        parser.seek(0)
+        parser.parse_expression()
+        self.assertEqual([error['message'] for error in error_handler.errors], ["Invalid expression"])
+
+class TestParserJSON(unittest.TestCase):
+    def test_write_ast_json_keeps_statements(self):
+        # The CLI used to write an empty program: save_ast_to_json() parsed
+        # the token stream a second time after parse() had consumed it.
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "prog.gox")
+            output = os.path.join(tmp, "prog.json")
+            code = "print 1;\nx = 2;\n"
+            error_handler = ErrorHandler()
+            ast = parse_cached(source, code, error_handler)
+            self.assertFalse(error_handler.has_errors())
+            write_ast_json(ast, output)
+            with open(output) as f:
+                data = json.load(f)
+        self.assertEqual(data["type"], "Program")
+        self.assertEqual([stmt["type"] for stmt in data["statements"]], ["Print", "Assignment"])
+
+    def test_parse_cached_reuses_pickle(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "prog.gox")
+            code = "print 1;"
+            first = parse_cached(source, code, ErrorHandler())
+            self.assertTrue(os.path.exists(os.path.join(tmp, "__pycache__", "prog.gox.ast.pickle")))
+            with mock.patch("GOX_parser.pickle.load", wraps=pickle.load) as load:
+                second = parse_cached(source, code, ErrorHandler())
+            load.assert_called_once()
+        self.assertEqual(repr(first), repr(second))
+
+    def test_stale_cache_is_not_unpickled(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "prog.gox")
+            parse_cached(source, "print 1;", ErrorHandler())
+            with mock.patch("GOX_parser.pickle.load") as load:
+                ast = parse_cached(source, "print 2;", ErrorHandler())
+            load.assert_not_called()
+            self.assertEqual(repr(ast), "Program([Print(Integer(2))])")
+            # The stale entry was replaced by the new program
+            self.assertEqual(repr(parse_cached(source, "print 2;", ErrorHandler())), repr(ast))
+
+    def test_foreign_cache_file_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "prog.gox")
+            os.makedirs(os.path.join(tmp, "__pycache__"))
+            with open(os.path.join(tmp, "__pycache__", "prog.gox.ast.pickle"), "wb") as f:
+                f.write(b"not a cache file")
+            with mock.patch("GOX_parser.pickle.load") as load:
+                ast = parse_cached(source, "print 3;", ErrorHandler())
+            load.assert_not_called()
+        self.assertEqual(repr(ast), "Program([Print(Integer(3))])")
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class TestParallelJSON(unittest.TestCase):
+    def setUp(self):
+        # 71 top-level statements (over the 64-statement threshold), with
+        # strings holding a raw newline, an escaped newline and a quote.
+        functions = "\n".join(
+            f"func f{i}(a int, b int) int {{\n"
+            f"  if a > {i} {{ print \"line\\n{i}\\\"q\\\"\"; }} else {{ print \"two\nlines\"; }}\n"
+            f"  return a * {i} + b;\n"
+            f"}}"
+            for i in range(70))
+        ast, messages = parse(functions + "\nprint 'x';")
+        self.assertEqual(messages, [])
+        self.program = ast
+        self.expected = _dumps(_serialize(ast))
+
+    def check(self, workers):
+        data, encoded = _dumps_program_parallel(self.program.statements, workers)
+        self.assertEqual(encoded, self.expected)
+        self.assertEqual(data, _serialize(self.program))
+
+    def test_matches_dumps(self):
+        self.assertEqual(len(self.program.statements), 71)
+        self.check(4)
+
+    def test_uneven_chunks(self):
+        # 71 statements split into chunks of 24, 24 and 23
+        self.check(3)
+
+    def test_single_chunk(self):
+        self.check(1)
+
+if __name__ == "__main__":
+    unittest.main()